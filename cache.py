@@ -0,0 +1,61 @@
+import hashlib
+import marshal
+import os
+import sys
+
+
+class ParseCache:
+    """On-disk cache of parsed scripts, keyed by their content hash.
+
+    The command list of a script is stored next to it (script.cql ->
+    script.cqlc) and reused while neither the script nor the grammar change.
+    """
+
+    def __init__(self, parser, verbose=False):
+        self.parser = parser
+        self.verbose = verbose
+        # marshal data is only readable by the same Python version
+        self.version = f"{parser.grammar_version()}-{sys.implementation.cache_tag}"
+
+    def cache_path(self, filename):
+        """Return the cache file used for a script."""
+        return os.path.splitext(filename)[0] + ".cqlc"
+
+    def log(self, message):
+        if self.verbose:
+            print(message)
+
+    def load(self, filename, content):
+        """Return the parsed commands of a script, parsing it only on a miss."""
+        path = self.cache_path(filename)
+        digest = hashlib.sha256(content.encode()).hexdigest()
+
+        try:
+            with open(path, "rb") as cache_file:
+                version, cached_digest, commands = marshal.load(cache_file)
+            if version == self.version and cached_digest == digest:
+                self.log(f"AST cache hit: {path}")
+                return commands
+            self.log(f"AST cache stale: {path}")
+        except FileNotFoundError:
+            self.log(f"AST cache miss: {path}")
+        except (OSError, EOFError, ValueError, TypeError) as e:
+            self.log(f"AST cache unreadable: {path} ({str(e)})")
+
+        commands = self.parser.parse(content)
+        # Scripts with syntax errors are parsed again on every run
+        if commands and not self.parser.errors:
+            self.store(path, (self.version, digest, commands))
+        return commands
+
+    def store(self, path, entry):
+        """Write a cache entry, replacing the previous one atomically."""
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as cache_file:
+                marshal.dump(entry, cache_file)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.log(f"AST cache not written: {path} ({str(e)})")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
@@ -0,0 +1,120 @@
+from spatial import parse_point
+
+
+def compare(cell_value, op, value):
+    """Compare a cell against a literal using the language's text semantics."""
+    if op == "=":
+        return str(cell_value) == str(value)
+    elif op == "<>":
+        return str(cell_value) != str(value)
+    elif op == "<":
+        return str(cell_value) < str(value)
+    elif op == ">":
+        return str(cell_value) > str(value)
+    elif op == "<=":
+        return str(cell_value) <= str(value)
+    elif op == ">=":
+        return str(cell_value) >= str(value)
+    return False
+
+
+def condition_columns(condition):
+    """Return the list of column names referenced by a condition."""
+    if condition[0] in ("CONDITION", "WITHIN", "NEAREST"):
+        return [condition[1]]
+    elif condition[0] == "AND":
+        return condition_columns(condition[1]) + condition_columns(condition[2])
+    return []
+
+
+def row_local(condition):
+    """Check whether each row can be tested on its own against a condition.
+
+    NEAREST depends on the other rows, so it has to see the whole table.
+    """
+    if condition[0] == "NEAREST":
+        return False
+    elif condition[0] == "AND":
+        return row_local(condition[1]) and row_local(condition[2])
+    return True
+
+
+def within(cell_value, min_lon, min_lat, max_lon, max_lat):
+    """Check whether a "[lon,lat]" cell lies inside a box, borders included."""
+    point = parse_point(cell_value)
+    if point is None:
+        return False
+    return min_lon <= point[0] <= max_lon and min_lat <= point[1] <= max_lat
+
+
+def bind(condition, header):
+    """Replace the column names in a condition with their header indices.
+
+    All referenced columns must exist in the header.
+    """
+    if condition[0] in ("CONDITION", "WITHIN"):
+        return (condition[0], header.index(condition[1])) + condition[2:]
+    elif condition[0] == "AND":
+        return ("AND", bind(condition[1], header), bind(condition[2], header))
+    return condition
+
+
+def matches(row, bound):
+    """Check whether a single row satisfies a condition returned by bind()."""
+    if bound[0] == "CONDITION":
+        return compare(row[bound[1]], bound[2], bound[3])
+    elif bound[0] == "WITHIN":
+        return within(row[bound[1]], *bound[2:])
+    elif bound[0] == "AND":
+        return matches(row, bound[1]) and matches(row, bound[2])
+    return True
+
+
+def conjuncts(condition):
+    """Split a condition into the list of conditions joined by AND."""
+    if condition[0] == "AND":
+        return conjuncts(condition[1]) + conjuncts(condition[2])
+    return [condition]
+
+
+def conjunction(conditions):
+    """Join a list of conditions with AND, or return None if it is empty."""
+    result = None
+    for condition in conditions:
+        result = condition if result is None else ("AND", result, condition)
+    return result
+
+
+def split_join_condition(header1, header2, col_name, condition):
+    """Plan a condition on the result of joining two tables on col_name.
+
+    Returns (condition1, condition2, residual): the parts that only read the
+    first table, the parts that only read the second table, and the parts
+    that must be checked on the joined rows. Each of them may be None.
+    Columns present in both tables resolve to the first one, like in the
+    joined header; the join column is checked on both sides.
+
+    NEAREST picks among the joined rows matching the conditions before it,
+    so it and the conditions after it are always checked on the joined rows.
+    """
+    parts = conjuncts(condition)
+    pushable = len(parts)
+    for i, part in enumerate(parts):
+        if not row_local(part):
+            pushable = i
+            break
+
+    side1, side2, residual = [], [], []
+    for part in parts[:pushable]:
+        columns = condition_columns(part)
+        if columns == [col_name]:
+            side1.append(part)
+            side2.append(part)
+        elif all(col in header1 for col in columns):
+            side1.append(part)
+        elif all(col in header2 and col not in header1 for col in columns):
+            side2.append(part)
+        else:
+            residual.append(part)
+    residual += parts[pushable:]
+    return conjunction(side1), conjunction(side2), conjunction(residual)
@@ -0,0 +1,125 @@
+import re
+from collections import namedtuple
+from itertools import islice
+
+# Column metadata of a query result: name and Python type of its values
+Column = namedtuple("Column", ["name", "type"])
+
+INTEGER = re.compile(r"^[-+]?\d+$")
+DECIMAL = re.compile(r"^[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?$")
+
+# Column types from the narrowest to the widest
+TYPES = [int, float, str]
+
+
+class QueryError(Exception):
+    """Raised when a query cannot be run, with the interpreter's message."""
+
+
+def value_type(value):
+    """Return the narrowest type a CSV value converts to, or None if empty."""
+    if value == "":
+        return None
+    if INTEGER.match(value):
+        return int
+    if DECIMAL.match(value):
+        return float
+    return str
+
+
+def infer_types(rows, types):
+    """Widen the column types in the list types to hold the values of rows.
+
+    None stands for a column that only held empty values so far.
+    """
+    for row in rows:
+        for i, current in enumerate(types):
+            if current is str or i >= len(row) or row[i] is None:
+                continue
+            found = value_type(row[i])
+            if found is not None and (
+                current is None or TYPES.index(found) > TYPES.index(current)
+            ):
+                types[i] = found
+    return types
+
+
+def converter(column_type):
+    """Return the function converting CSV values to a numeric column type.
+
+    Empty values become None.
+    """
+    return lambda value: column_type(value) if value != "" else None
+
+
+def format_table(header, rows):
+    """Format a header and rows of strings as the interpreter prints them."""
+    result = []
+    header_str = " | ".join(header)
+    result.append(header_str)
+    result.append("-" * len(header_str))
+
+    for row in rows:
+        result.append(" | ".join(row))
+
+    return "\n".join(result)
+
+
+class Cursor:
+    """Rows of a query result, projected and converted as they are fetched.
+
+    rows yields the matching table rows; only the values at col_indices are
+    kept, or the whole rows when col_indices is None, however many values
+    they hold. Without types the values are left as the strings read from
+    the CSV, as they are for columns of type None (only empty values).
+    """
+
+    arraysize = 1
+
+    def __init__(self, header, rows, col_indices, types=None):
+        self.whole_rows = col_indices is None
+        if col_indices is None:
+            col_indices = range(len(header))
+        if types is None:
+            types = [str] * len(col_indices)
+        types = [str if column_type is None else column_type for column_type in types]
+        self.description = [
+            Column(header[i], column_type) for i, column_type in zip(col_indices, types)
+        ]
+        self.rows = iter(rows)
+        # (column index, conversion or None to keep the string) per value
+        self.fields = [
+            (i, None if column_type is str else converter(column_type))
+            for i, column_type in zip(col_indices, types)
+        ]
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        row = next(self.rows)
+        if self.whole_rows:
+            # Values past the header are kept as they are
+            converters = [convert for _, convert in self.fields]
+            return tuple(
+                value
+                if i >= len(converters) or converters[i] is None
+                else converters[i](value)
+                for i, value in enumerate(row)
+            )
+        return tuple(
+            row[i] if convert is None else convert(row[i])
+            for i, convert in self.fields
+        )
+
+    def fetchone(self):
+        """Return the next row, or None when there are no more rows."""
+        return next(self, None)
+
+    def fetchmany(self, size=None):
+        """Return a list with up to size more rows (arraysize by default)."""
+        return list(islice(self, self.arraysize if size is None else size))
+
+    def fetchall(self):
+        """Return a list with the remaining rows."""
+        return list(self)
@@ -3,6 +3,7 @@ import os
 from lexer import Lexer
 from parser import Parser
 from interpreter import Interpreter
+from cache import ParseCache
 from pprint import PrettyPrinter
 import graphviz
 
@@ -63,9 +64,14 @@ def main():
     parser = Parser()
     interpreter = Interpreter()
 
+    # Options: -v/--verbose reports AST cache use, --no-cache always parses
+    options = [arg for arg in sys.argv[1:] if arg.startswith("-")]
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("-")]
+    verbose = "-v" in options or "--verbose" in options
+
     # Check if a file was provided as an argument
-    if len(sys.argv) > 1:
-        filename = sys.argv[1]
+    if args:
+        filename = args[0]
         # Check if the file exists and has .cql extension
         if not os.path.exists(filename):
             print(f"Error: File {filename} does not exist.", file=sys.stderr)
@@ -76,7 +82,10 @@ def main():
 
         content = read_file(filename)
         try:
-            ast = parser.parse(content)
+            if "--no-cache" in options:
+                ast = parser.parse(content)
+            else:
+                ast = ParseCache(parser, verbose).load(filename, content)
 
             # Create visual representation for each command
             base_name = os.path.splitext(os.path.basename(filename))[0]
@@ -94,7 +103,7 @@ def main():
                 visualize_ast(ast, output_file=base_name)
 
             print("\nExecution Results:")
-            result = interpreter.interpret(content)
+            result = interpreter.execute(ast)
             if result:
                 if isinstance(result, list):
                     for res in result:
@@ -118,7 +127,7 @@ def main():
                 # Create visual representation
                 visualize_ast(ast, output_file="interactive_ast")
                 # Execute the command
-                result = interpreter.interpret(line)
+                result = interpreter.execute(ast)
                 if result:
                     print(f"<< {result}")
             except KeyboardInterrupt:
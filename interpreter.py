@@ -1,24 +1,96 @@
-import csv
 import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from parser import Parser
+from conditions import (
+    compare,
+    condition_columns,
+    conjunction,
+    conjuncts,
+    row_local,
+    split_join_condition,
+)
+from cursor import Cursor, QueryError, format_table, infer_types
+from parallel import PartitionedExecutor
+from vectorized import VectorizedBackend, available as vectorized_available
+from windows import (
+    column_name,
+    has_windows,
+    is_window,
+    referenced_columns,
+    validate,
+    window_values,
+)
+from spatial import GridIndex, is_point_column, parse_point
+from storage import (
+    COMPRESSIONS,
+    compression_for,
+    file_source,
+    holds_row,
+    open_text,
+    read_appended,
+    read_rows,
+    same_file,
+    write_csv_atomic,
+)
 
 
 class Interpreter:
-    def __init__(self):
+    def __init__(self, parallelism=1, parallel_threshold=100000, backend="auto"):
         self.parser = Parser()
         # Dictionary to store tables
         self.tables = {}
         # Dictionary to store procedures
         self.procedures = {}
+        # Tables with at least parallel_threshold rows are filtered and joined
+        # in partitions across parallelism worker processes (None for one per
+        # CPU)
+        self.executor = PartitionedExecutor(parallelism, parallel_threshold)
+        # Execution backend for filters and projections: "python", "numpy", or
+        # "auto" to use NumPy when it is installed
+        if backend == "numpy" and not vectorized_available():
+            raise ValueError("The numpy backend requires NumPy to be installed.")
+        if backend == "numpy" or (backend == "auto" and vectorized_available()):
+            self.vectorized = VectorizedBackend()
+        else:
+            self.vectorized = None
+        # Columns the parsed commands read from each table (None for all of
+        # them), loaded when a lazily imported table is first used
+        self.referenced = {}
 
     def interpret(self, code):
         """Parse and execute the code."""
-        parsed = self.parser.parse(code)
-        if not parsed:
+        return self.execute(self.parser.parse(code))
+
+    def query(self, code):
+        """Run a single SELECT command and return a Cursor over its rows.
+
+        Values are converted to int or float for the columns whose values all
+        read as numbers. Raises QueryError when the query cannot be run.
+        """
+        if not code.rstrip().endswith(";"):
+            code = code.rstrip() + ";"
+        commands = self.parser.parse(code)
+        if self.parser.errors or not commands:
+            raise QueryError("Error: Invalid query.")
+        if len(commands) != 1 or commands[0][0] != "SELECT":
+            raise QueryError("Error: Only a single SELECT command can be queried.")
+
+        self.reference_columns(commands)
+        command = commands[0]
+        error = self.prepare_command(command)
+        if error:
+            raise QueryError(error)
+        return self.open_cursor(*command[1:5], typed=True)
+
+    def execute(self, commands):
+        """Execute a list of already parsed commands."""
+        if not commands:
             return None
 
+        self.reference_columns(commands)
         results = []
-        for command in parsed:
+        for command in commands:
             result = self.execute_command(command)
             if result:
                 results.append(result)
@@ -27,18 +99,25 @@ class Interpreter:
     def execute_command(self, command):
         """Execute a single command."""
         cmd_type = command[0]
+        error = self.prepare_command(command)
+        if error:
+            return error
 
         # Table commands
         if cmd_type == "IMPORT":
-            return self.import_table(command[1], command[2])
+            return self.import_table(command[1], command[2], command[3])
         elif cmd_type == "EXPORT":
-            return self.export_table(command[1], command[2])
+            return self.export_table(command[1], command[2], command[3])
+        elif cmd_type == "EXPORT_TABLES":
+            return self.export_tables(command[1], command[2], command[3])
         elif cmd_type == "DISCARD":
             return self.discard_table(command[1])
         elif cmd_type == "RENAME":
             return self.rename_table(command[1], command[2])
         elif cmd_type == "PRINT":
             return self.print_table(command[1])
+        elif cmd_type == "REFRESH":
+            return self.refresh_table(command[1])
 
         # Query commands
         elif cmd_type == "SELECT":
@@ -60,13 +139,18 @@ class Interpreter:
             )
             return self.create_table_select(new_table, columns, table_name, condition)
         elif cmd_type == "CREATE_JOIN":
-            new_table, table1, table2, col_name = (
+            new_table, table1, table2, col_name, condition = (
                 command[1],
                 command[2],
                 command[3],
                 command[4],
+                command[5],
+            )
+            return self.create_table_join(
+                new_table, table1, table2, col_name, condition
             )
-            return self.create_table_join(new_table, table1, table2, col_name)
+        elif cmd_type == "CREATE_MATERIALIZED":
+            return self.create_materialized(command[1])
 
         # Procedure commands
         elif cmd_type == "PROCEDURE":
@@ -75,8 +159,14 @@ class Interpreter:
             return self.call_procedure(command[1])
 
     # CSV handling functions
-    def read_csv(self, filename):
-        """Read a CSV file and return its data as a dictionary."""
+    def read_csv(self, filename, columns=None):
+        """Read a possibly compressed CSV file and return its data as a dictionary.
+
+        The "source" entry records where the file ended, so rows appended to
+        it later can be read incrementally. When columns is given, only the
+        values of those columns are kept and the others are left as None
+        until load_table() reads them.
+        """
         if not os.path.exists(filename):
             print(f"Error: File {filename} does not exist.")
             return None
@@ -84,60 +174,405 @@ class Interpreter:
         try:
             data = []
             header = None
+            keep = None
 
-            with open(filename, "r", newline="") as csvfile:
-                reader = csv.reader(csvfile)
-                for row in reader:
-                    # Skip comment lines
-                    if row and row[0].startswith("#"):
-                        continue
-
+            with open_text(filename) as csvfile:
+                for row in read_rows(csvfile):
                     # First non-comment line is the header
                     if header is None:
                         header = row
-                    else:
+                        if columns is not None:
+                            keep = [i for i, col in enumerate(header) if col in columns]
+                            if len(keep) == len(header):
+                                keep = None
+                            blank = [None] * len(header)
+                    elif keep is None or len(row) != len(header):
                         data.append(row)
+                    else:
+                        pruned = blank.copy()
+                        for i in keep:
+                            pruned[i] = row[i]
+                        data.append(pruned)
 
-            return {"header": header, "data": data}
+                source, fragment = file_source(csvfile, filename)
+
+            # The next refresh reads a last line without its newline again,
+            # in place of its row, unless it holds the header
+            source["partial"] = bool(data) and holds_row(fragment, csvfile.encoding)
+            if not data and source["offset"] is not None:
+                source["offset"] += len(fragment)
+
+            table = {"header": header, "data": data, "source": source}
+            if keep is not None:
+                table["lazy"] = {
+                    "filename": filename,
+                    "columns": {header[i] for i in keep},
+                }
+            return table
         except Exception as e:
             print(f"Error reading CSV file: {str(e)}")
             return None
 
-    def write_csv(self, table, filename):
-        """Write a table to a CSV file."""
+    def read_header(self, filename):
+        """Read only the header of a possibly compressed CSV file."""
+        if not os.path.exists(filename):
+            print(f"Error: File {filename} does not exist.")
+            return None
+
+        try:
+            with open_text(filename) as csvfile:
+                for row in read_rows(csvfile):
+                    return row
+            print(f"Error: File {filename} has no header.")
+            return None
+        except Exception as e:
+            print(f"Error reading CSV file: {str(e)}")
+            return None
+
+    def write_csv(self, table, filename, compression=None):
+        """Write a table to a CSV file, replacing it atomically."""
         try:
-            with open(filename, "w", newline="") as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(table["header"])
-                writer.writerows(table["data"])
+            write_csv_atomic(filename, table["header"], table["data"], compression)
             return True
         except Exception as e:
             print(f"Error writing CSV file: {str(e)}")
             return False
 
     # Table commands implementation
-    def import_table(self, table_name, filename):
-        """Import a table from a CSV file."""
-        data = self.read_csv(filename)
-        if data:
+    def import_table(self, table_name, filename, append=False):
+        """Import a table from a CSV file.
+
+        Only the header is read here: the rows are read when the table is
+        first used, keeping just the columns the commands refer to.
+
+        With append, a table already imported from the same file only gets
+        the rows added to the file since it was last read.
+        """
+        if append and table_name in self.tables:
+            lazy = self.tables[table_name].get("lazy", {})
+            source = self.tables[table_name].get("source", lazy)
+            if source.get("filename") != filename:
+                return (
+                    f"Error: Table '{table_name}' was not imported from '{filename}'."
+                )
+            return self.refresh_table(table_name)
+
+        header = self.read_header(filename)
+        if header:
+            data = {
+                "header": header,
+                "data": [],
+                "lazy": {"filename": filename, "columns": None},
+            }
+            replaced = table_name in self.tables
             self.tables[table_name] = data
+            if replaced:
+                self.rebuild_dependents(table_name)
             return f"Table '{table_name}' imported successfully."
 
-    def export_table(self, table_name, filename):
-        """Export a table to a CSV file."""
+    def refresh_table(self, table_name):
+        """Bring a table up to date with the data it comes from.
+
+        A materialized table is rebuilt from its definition. A table imported
+        from a file gets the rows appended to the file since it was last read;
+        a file that was truncated, replaced or is compressed is reloaded
+        entirely instead.
+        """
+        if table_name not in self.tables:
+            return f"Error: Table '{table_name}' does not exist."
+        table = self.tables[table_name]
+        if "definition" in table:
+            return self.rebuild_materialized(table_name)
+        error = self.load_table(table_name, ())
+        if error:
+            return error
+        source = table.get("source")
+        if source is None:
+            return f"Error: Table '{table_name}' was not imported from a file."
+
+        filename = source["filename"]
+        if not os.path.exists(filename):
+            return f"Error: File {filename} does not exist."
+        try:
+            appended = read_appended(source)
+        except OSError as e:
+            return f"Error reading CSV file: {str(e)}"
+
+        rows = None
+        if appended is not None:
+            csvfile, updated = appended
+            rows = list(read_rows(csvfile))
+        # The last row came from a line without its newline, which is read
+        # again: a file cut before that line is reloaded too
+        if rows is None or (source.get("partial") and not rows):
+            data = self.read_csv(filename)
+            if not data:
+                return f"Error reloading table '{table_name}'."
+            self.index_points(data)
+            self.tables[table_name] = data
+            self.rebuild_dependents(table_name)
+            return f"Table '{table_name}' reloaded from '{filename}'."
+
+        if source.get("partial"):
+            self.replace_last_row(table_name, rows.pop(0))
+        table["source"] = updated
+        self.append_rows(table_name, rows)
+        return f"{len(rows)} rows appended to table '{table_name}'."
+
+    def replace_last_row(self, table_name, row):
+        """Replace the last row of a table with the row read again from its
+        line, once more of the line was written.
+
+        Materialized tables defined over it are recomputed if a value changed.
+        """
+        table = self.tables[table_name]
+        last = table["data"][-1]
+        table["data"][-1] = row
+        # Values not read yet by a lazy import are None
+        if len(last) == len(row) and all(
+            value is None or value == row[i] for i, value in enumerate(last)
+        ):
+            return
+        for key in ("arrays", "types", "indexes", "shared"):
+            table.pop(key, None)
+        self.index_points(table)
+        self.rebuild_dependents(table_name)
+
+    def append_rows(self, table_name, rows):
+        """Append rows to an existing table.
+
+        Materialized tables defined over it get the matching new rows too.
+        """
+        table = self.tables[table_name]
+        table["data"].extend(rows)
+        if not rows:
+            return
+        # The worker processes' copy of the rows is made again when needed
+        table.pop("shared", None)
+
+        for col_name, index in table.get("indexes", {}).items():
+            col_index = table["header"].index(col_name)
+            index.add(parse_point(row[col_index]) for row in rows)
+
+        for derived_name in self.dependents(table_name):
+            # NEAREST and window aggregates depend on other rows, so those
+            # tables are recomputed
+            definition = self.tables[derived_name]["definition"]
+            condition = definition[4 if definition[0] == "CREATE_SELECT" else 5]
+            windowed = definition[0] == "CREATE_SELECT" and has_windows(definition[2])
+            if windowed or (condition and not row_local(condition)):
+                self.rebuild_materialized(derived_name)
+                continue
+
+            delta = self.materialize_delta(derived_name, table_name, rows)
+            if delta is None:
+                # The base table changed shape: the rebuild detaches the table
+                self.rebuild_materialized(derived_name)
+            elif delta:
+                self.append_rows(derived_name, delta)
+
+    # Lazy imports implementation
+    def reference_columns(self, commands):
+        """Record the columns a list of parsed commands reads from each table,
+        including the commands of the procedures they define.
+        """
+        for command in commands:
+            if command[0] == "PROCEDURE":
+                self.reference_columns(command[2])
+                continue
+            for table_name, columns in self.command_columns(command).items():
+                referenced = self.referenced.get(table_name, set())
+                if referenced is None or columns is None:
+                    self.referenced[table_name] = None
+                else:
+                    self.referenced[table_name] = referenced | columns
+
+    def prepare_command(self, command):
+        """Read the columns a command needs from lazily imported tables.
+
+        Returns an error message, or None.
+        """
+        for table_name, columns in self.command_columns(command).items():
+            error = self.load_table(table_name, columns)
+            if error:
+                return error
+        return None
+
+    def command_columns(self, command):
+        """Return the columns a command reads from each table, as a set of
+        column names or None for all of them.
+        """
+        cmd_type = command[0]
+        if cmd_type in ("EXPORT", "PRINT"):
+            return {command[1]: None}
+        elif cmd_type == "EXPORT_TABLES":
+            return {table_name: None for table_name in command[1]}
+        elif cmd_type == "CREATE_JOIN":
+            return {command[2]: None, command[3]: None}
+        elif cmd_type == "CREATE_MATERIALIZED":
+            return self.command_columns(command[1])
+        elif cmd_type == "SELECT":
+            columns, table_name, condition = command[1], command[2], command[3]
+        elif cmd_type == "CREATE_SELECT":
+            columns, table_name, condition = command[2], command[3], command[4]
+        else:
+            return {}
+
+        if columns == "*":
+            return {table_name: None}
+        columns = set(referenced_columns(columns))
+        if condition:
+            columns.update(condition_columns(condition))
+        return {table_name: columns}
+
+    def load_table(self, table_name, columns=None):
+        """Read the columns of a lazily imported table that are still missing.
+
+        columns holds the names of the columns needed, or None for all of
+        them. The first read also keeps every column the commands executed so
+        far refer to. Returns an error message, or None.
+        """
+        table = self.tables.get(table_name)
+        if table is None or "lazy" not in table:
+            return None
+        lazy = table["lazy"]
+        header = table["header"]
+        if columns is None or self.referenced.get(table_name, ()) is None:
+            wanted = set(header)
+        else:
+            wanted = set(columns) | self.referenced.get(table_name, set())
+            wanted.intersection_update(header)
+
+        if lazy["columns"] is None:
+            loaded = self.read_csv(lazy["filename"], wanted)
+            if not loaded:
+                return f"Error loading table '{table_name}'."
+            table.pop("lazy")
+            table.update(loaded)
+            self.index_points(table)
+            return None
+
+        missing = [header.index(col) for col in wanted - lazy["columns"]]
+        if not missing:
+            return None
+        if not self.fill_columns(table, missing):
+            # The rows no longer line up with the file: read it again
+            loaded = self.read_csv(lazy["filename"], wanted | lazy["columns"])
+            if not loaded:
+                return f"Error loading table '{table_name}'."
+            table.clear()
+            table.update(loaded)
+            self.index_points(table)
+            self.rebuild_dependents(table_name)
+            return None
+
+        lazy["columns"].update(header[i] for i in missing)
+        if len(lazy["columns"]) == len(header):
+            del table["lazy"]
+        # Arrays, types and the shared copy were built before these values
+        # were read
+        table.pop("arrays", None)
+        table.pop("types", None)
+        table.pop("shared", None)
+        self.index_points(table)
+        return None
+
+    def fill_columns(self, table, col_indices):
+        """Read the values of some columns into the rows of a table, from the
+        file it was imported from.
+
+        The file rows are matched to the table rows in order, and the values
+        already loaded must be the same in both. Returns False, leaving the
+        table partly filled, if the file no longer holds the rows of the
+        table or a table row did not come from it.
+        """
+        data = table["data"]
+        header = table["header"]
+        # The values already loaded identify the file row of each table row
+        loaded = [i for i, col in enumerate(header) if col in table["lazy"]["columns"]]
+        if not loaded:
+            return False
+        try:
+            with open(table["source"]["filename"], "rb") as file:
+                if not same_file(file, table["source"]):
+                    return False
+            with open_text(table["source"]["filename"]) as csvfile:
+                rows = read_rows(csvfile)
+                next(rows, None)
+                filled = 0
+                for row, file_row in zip(data, rows):
+                    if len(row) != len(file_row):
+                        return False
+                    # Short rows were kept whole when they were read
+                    for i in loaded:
+                        if i < len(row) and row[i] != file_row[i]:
+                            return False
+                    for i in col_indices:
+                        if i < len(row):
+                            row[i] = file_row[i]
+                    filled += 1
+        except OSError:
+            return False
+        return filled == len(data)
+
+    def export_table(self, table_name, filename, compression=None):
+        """Export a table to a CSV file, optionally compressed."""
         if table_name not in self.tables:
             return f"Error: Table '{table_name}' does not exist."
+        try:
+            compression = compression_for(filename, compression)
+        except ValueError as e:
+            return f"Error: {str(e)}"
 
-        if self.write_csv(self.tables[table_name], filename):
+        if self.write_csv(self.tables[table_name], filename, compression):
             return f"Table '{table_name}' exported successfully to '{filename}'."
         return f"Error exporting table '{table_name}'."
 
+    def export_tables(self, table_names, directory, compression=None):
+        """Export several tables concurrently to CSV files in a directory."""
+        for table_name in table_names:
+            if table_name not in self.tables:
+                return f"Error: Table '{table_name}' does not exist."
+        try:
+            compression = compression_for("", compression)
+        except ValueError as e:
+            return f"Error: {str(e)}"
+        extension = ".csv" + (COMPRESSIONS[compression][1] if compression else "")
+
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError as e:
+            return f"Error creating directory '{directory}': {str(e)}"
+
+        # Each table is written by its own thread
+        with ThreadPoolExecutor(max_workers=len(table_names)) as pool:
+            written = list(
+                pool.map(
+                    lambda table_name: self.write_csv(
+                        self.tables[table_name],
+                        os.path.join(directory, table_name + extension),
+                        compression,
+                    ),
+                    table_names,
+                )
+            )
+
+        names = ", ".join(f"'{table_name}'" for table_name in table_names)
+        if all(written):
+            return f"Tables {names} exported successfully to '{directory}'."
+        failed = [name for name, ok in zip(table_names, written) if not ok]
+        names = ", ".join(f"'{table_name}'" for table_name in failed)
+        return f"Error exporting tables {names}."
+
     def discard_table(self, table_name):
         """Remove a table from memory."""
         if table_name not in self.tables:
             return f"Error: Table '{table_name}' does not exist."
 
         del self.tables[table_name]
+        # Tables materialized from it keep their rows as plain tables
+        for derived_name in self.dependents(table_name):
+            del self.tables[derived_name]["definition"]
         return f"Table '{table_name}' discarded successfully."
 
     def rename_table(self, old_name, new_name):
@@ -149,6 +584,18 @@ class Interpreter:
 
         self.tables[new_name] = self.tables[old_name]
         del self.tables[old_name]
+
+        # Keep the definitions of materialized tables pointing at the table
+        for table in self.tables.values():
+            definition = table.get("definition")
+            if definition is None:
+                continue
+            # Positions of the source table names in the command
+            positions = (3,) if definition[0] == "CREATE_SELECT" else (2, 3)
+            table["definition"] = tuple(
+                new_name if i in positions and part == old_name else part
+                for i, part in enumerate(definition)
+            )
         return f"Table '{old_name}' renamed to '{new_name}' successfully."
 
     def print_table(self, table_name):
@@ -157,40 +604,127 @@ class Interpreter:
             return f"Error: Table '{table_name}' does not exist."
 
         table = self.tables[table_name]
-        result = []
-
-        # Print header
-        header_str = " | ".join(table["header"])
-        result.append(header_str)
-        result.append("-" * len(header_str))
-
-        # Print data
-        for row in table["data"]:
-            result.append(" | ".join(row))
-
-        return "\n".join(result)
+        return format_table(table["header"], table["data"])
 
     # Query commands implementation
     def select_data(self, columns, table_name, condition, limit):
         """Select data from a table with optional condition and limit."""
+        try:
+            cursor = self.open_cursor(columns, table_name, condition, limit)
+        except QueryError as e:
+            return str(e)
+        return format_table([column.name for column in cursor.description], cursor)
+
+    def open_cursor(self, columns, table_name, condition, limit, typed=False):
+        """Return a Cursor over the rows of a table matching a condition, up to
+        limit rows, projected on the selected columns ("*" for all of them).
+
+        With typed, numeric columns are converted from their CSV strings.
+        Raises QueryError when the table or a column does not exist.
+        """
         if table_name not in self.tables:
-            return f"Error: Table '{table_name}' does not exist."
+            raise QueryError(f"Error: Table '{table_name}' does not exist.")
 
         table = self.tables[table_name]
         header = table["header"]
         data = table["data"]
 
         # If columns is *, select all columns
-        if columns == "*":
-            selected_cols = header
+        whole_rows = columns == "*"
+        if whole_rows:
+            columns = header
         else:
-            # Verify that all specified columns exist
+            error = self.check_columns(columns, header, table_name)
+            if error:
+                raise QueryError(error)
+        for col in condition_columns(condition) if condition else []:
+            if col not in header:
+                raise QueryError(
+                    f"Error: Column '{col}' does not exist in table '{table_name}'."
+                )
+
+        # Window aggregates are computed over every matching row first
+        if has_windows(columns):
+            rows = self.select_rows(data, header, columns, condition, limit)
+            names = [column_name(col) for col in columns]
+            types = infer_types(rows, [None] * len(names)) if typed else None
+            return Cursor(names, rows, range(len(names)), types)
+        col_indices = [header.index(col) for col in columns]
+        types = None
+        if typed:
+            column_types = self.column_types(table)
+            types = [column_types[i] for i in col_indices]
+
+        # Vectorized filter, limit and projection over column arrays
+        if self.vectorized is not None:
+            rows = self.vectorized.select(
+                data,
+                header,
+                condition,
+                None if whole_rows else col_indices,
+                limit,
+                self.array_cache(data, header),
+            )
+            if rows is not None and whole_rows:
+                return Cursor(header, rows, None, types)
+            if rows is not None:
+                return Cursor(columns, rows, range(len(columns)), types)
+
+        # Without a condition rows are read from the table as they are fetched
+        if condition:
+            rows = self.filter_by_condition(data, header, condition)
+        else:
+            rows = data
+        if limit and limit > 0:
+            rows = islice(rows, limit)
+
+        # Rows of any length are returned whole by *, as they were read
+        return Cursor(header, rows, None if whole_rows else col_indices, types)
+
+    def check_columns(self, columns, header, table_name):
+        """Return an error message if a select list reads a column missing
+        from a table or holds an invalid window aggregate, or None.
+        """
+        # Verify that all specified columns exist
+        for col in referenced_columns(columns):
+            if col not in header:
+                return f"Error: Column '{col}' does not exist in table '{table_name}'."
+        try:
             for col in columns:
-                if col not in header:
-                    return (
-                        f"Error: Column '{col}' does not exist in table '{table_name}'."
-                    )
-            selected_cols = columns
+                if is_window(col):
+                    validate(col)
+        except ValueError as e:
+            return f"Error: {str(e)}"
+        return None
+
+    def column_types(self, table):
+        """Return the type of the values of each column of a table.
+
+        Types are kept with the table and only widened by appended rows.
+        """
+        data = table["data"]
+        count, types = table.get("types", (0, [None] * len(table["header"])))
+        if count != len(data):
+            types = infer_types(data[count:], list(types))
+            table["types"] = (len(data), types)
+        return [str if column_type is None else column_type for column_type in types]
+
+    def select_rows(self, data, header, columns, condition, limit=None):
+        """Filter rows by an optional condition, keep up to limit of them and
+        project them on the selected columns ("*" keeps whole rows).
+        """
+        if has_windows(columns):
+            return self.window_rows(data, header, columns, condition, limit)
+        col_indices = None if columns == "*" else [header.index(col) for col in columns]
+
+        # Vectorized filter, limit and projection over column arrays
+        if self.vectorized is not None:
+            arrays = self.array_cache(data, header)
+            rows = self.vectorized.select(
+                data, header, condition, col_indices, limit, arrays
+            )
+            if rows is not None:
+                return rows
 
         # Filter rows by condition if specified
         if condition:
@@ -203,27 +737,60 @@ class Interpreter:
             filtered_data = filtered_data[:limit]
 
         # Project only the selected columns
-        if columns == "*":
-            result_header = header
-            result_data = filtered_data
-        else:
-            col_indices = [header.index(col) for col in selected_cols]
-            result_header = selected_cols
-            result_data = [[row[i] for i in col_indices] for row in filtered_data]
+        if col_indices is None:
+            return filtered_data
+        return [[row[i] for i in col_indices] for row in filtered_data]
 
-        # Format the result
-        result = []
-        header_str = " | ".join(result_header)
-        result.append(header_str)
-        result.append("-" * len(header_str))
+    def window_rows(self, data, header, columns, condition, limit=None):
+        """Select rows like select_rows(), with the window aggregates of the
+        select list computed over all the rows matching the condition.
+        """
+        rows = self.filter_by_condition(data, header, condition) if condition else data
 
-        for row in result_data:
-            result.append(" | ".join(row))
+        # Each window aggregate is computed once for all rows
+        values = {}
+        for col in columns:
+            if is_window(col) and col not in values:
+                values[col] = window_values(rows, header, col)
+        fields = [
+            values[col] if is_window(col) else header.index(col) for col in columns
+        ]
 
-        return "\n".join(result)
+        if limit and limit > 0:
+            rows = rows[:limit]
+        return [
+            [row[field] if type(field) is int else field[row_id] for field in fields]
+            for row_id, row in enumerate(rows)
+        ]
 
     def filter_by_condition(self, data, header, condition):
         """Filter table data by a condition."""
+        # Vectorized filter over column arrays
+        if self.vectorized is not None:
+            arrays = self.array_cache(data, header)
+            rows = self.vectorized.select(data, header, condition, None, None, arrays)
+            if rows is not None:
+                return rows
+
+        # The terms of a row-local condition can be applied in any order, so
+        # WITHIN goes first and is answered from the index of the whole table
+        parts = conjuncts(condition)
+        spatial = [part for part in parts if part[0] == "WITHIN"]
+        if spatial and parts[0][0] != "WITHIN" and row_local(condition):
+            rest = [part for part in parts if part[0] != "WITHIN"]
+            condition = conjunction(spatial + rest)
+
+        # Large tables are split in partitions and filtered in parallel
+        if (
+            self.executor.enabled_for(len(data))
+            and row_local(condition)
+            and not spatial
+            and all(col in header for col in condition_columns(condition))
+        ):
+            shared = self.shared_rows(data, header)
+            indices = self.executor.filter_indices(data, header, condition, shared)
+            return [data[i] for i in indices]
+
         if condition[0] == "CONDITION":
             col_name, op, value = condition[1], condition[2], condition[3]
 
@@ -237,23 +804,30 @@ class Interpreter:
             # Filter the data
             filtered = []
             for row in data:
-                cell_value = row[col_index]
-
-                if op == "=" and str(cell_value) == str(value):
-                    filtered.append(row)
-                elif op == "<>" and str(cell_value) != str(value):
-                    filtered.append(row)
-                elif op == "<" and str(cell_value) < str(value):
-                    filtered.append(row)
-                elif op == ">" and str(cell_value) > str(value):
-                    filtered.append(row)
-                elif op == "<=" and str(cell_value) <= str(value):
-                    filtered.append(row)
-                elif op == ">=" and str(cell_value) >= str(value):
+                if compare(row[col_index], op, value):
                     filtered.append(row)
 
             return filtered
 
+        elif condition[0] in ("WITHIN", "NEAREST"):
+            col_name = condition[1]
+            if col_name not in header:
+                print(f"Error: Column '{col_name}' does not exist.")
+                return data
+
+            # Answered from the index of a table column, or from a grid built
+            # over these rows when they are not a whole table
+            index = self.spatial_index(data, header, col_name)
+            if index is None:
+                col_index = header.index(col_name)
+                index = GridIndex([parse_point(row[col_index]) for row in data])
+
+            if condition[0] == "WITHIN":
+                row_ids = index.within(*condition[2:6])
+            else:
+                row_ids = index.nearest(*condition[2:5])
+            return [data[i] for i in row_ids]
+
         elif condition[0] == "AND":
             # Apply both conditions
             left_filtered = self.filter_by_condition(data, header, condition[1])
@@ -261,6 +835,60 @@ class Interpreter:
 
         return data
 
+    # Spatial indexes implementation
+    def index_points(self, table):
+        """Index the "[lon,lat]" coordinate columns of a table."""
+        indexes = table.setdefault("indexes", {})
+        for col_index, col_name in enumerate(table["header"]):
+            if col_name not in indexes and is_point_column(table["data"], col_index):
+                indexes[col_name] = GridIndex(
+                    parse_point(row[col_index]) for row in table["data"]
+                )
+
+    def table_holding(self, data, header):
+        """Return the table whose row list is data, or None for row lists
+        that are not a whole table.
+        """
+        for table in self.tables.values():
+            if table["data"] is data and table["header"] is header:
+                return table
+        return None
+
+    def array_cache(self, data, header):
+        """Return the NumPy array cache of the table holding data, or None."""
+        table = self.table_holding(data, header)
+        return None if table is None else table.setdefault("arrays", {})
+
+    def shared_rows(self, data, header):
+        """Return the shared memory copy of the table holding data for the
+        worker processes, or None for row lists that are not a whole table.
+
+        The copy is made on first use and kept until the rows change.
+        """
+        table = self.table_holding(data, header)
+        if table is None:
+            return None
+        shared = table.get("shared")
+        if shared is None or shared.count != len(data):
+            table["shared"] = shared = self.executor.share(data)
+        return shared
+
+    def spatial_index(self, data, header, col_name):
+        """Return the spatial index of a column of the table holding data, or
+        None if data is not the whole row list of a table.
+        """
+        table = self.table_holding(data, header)
+        if table is None:
+            return None
+        indexes = table.setdefault("indexes", {})
+        index = indexes.get(col_name)
+        # Indexes are built on first use for tables not imported from files
+        if index is None or len(index) != len(data):
+            col_index = header.index(col_name)
+            index = GridIndex(parse_point(row[col_index]) for row in data)
+            indexes[col_name] = index
+        return index
+
     # Create commands implementation
     def create_table_select(self, new_table, columns, table_name, condition):
         """Create a new table from a select query."""
@@ -277,36 +905,28 @@ class Interpreter:
         if columns == "*":
             selected_cols = header
         else:
-            # Verify that all specified columns exist
-            for col in columns:
-                if col not in header:
-                    return (
-                        f"Error: Column '{col}' does not exist in table '{table_name}'."
-                    )
-            selected_cols = columns
+            error = self.check_columns(columns, header, table_name)
+            if error:
+                return error
+            selected_cols = [column_name(col) for col in columns]
 
-        # Filter rows by condition if specified
-        if condition:
-            filtered_data = self.filter_by_condition(data, header, condition)
-        else:
-            filtered_data = data
-
-        # Project only the selected columns
-        if columns == "*":
-            result_header = header
-            result_data = filtered_data
-        else:
-            col_indices = [header.index(col) for col in selected_cols]
-            result_header = selected_cols
-            result_data = [[row[i] for i in col_indices] for row in filtered_data]
+        result_header = selected_cols
+        result_data = self.select_rows(data, header, columns, condition)
+        if result_data is data:
+            # Copied so that rows appended to the source do not show up here
+            result_data = list(result_data)
 
         # Create the new table
         self.tables[new_table] = {"header": result_header, "data": result_data}
 
         return f"Table '{new_table}' created successfully."
 
-    def create_table_join(self, new_table, table1, table2, col_name):
-        """Create a new table by joining two tables on a common column."""
+    def create_table_join(self, new_table, table1, table2, col_name, condition=None):
+        """Create a new table by joining two tables on a common column.
+
+        The parts of the condition that read a single table are applied to
+        that table before the join, the rest to the joined rows.
+        """
         if table1 not in self.tables:
             return f"Error: Table '{table1}' does not exist."
         if table2 not in self.tables:
@@ -323,29 +943,194 @@ class Interpreter:
         if col_name not in t2["header"]:
             return f"Error: Column '{col_name}' does not exist in table '{table2}'."
 
-        # Get column indices
-        t1_col_idx = t1["header"].index(col_name)
-        t2_col_idx = t2["header"].index(col_name)
-
         # Create new header (excluding the duplicate join column)
         new_header = t1["header"] + [col for col in t2["header"] if col != col_name]
 
         # Create new data (join where column values match)
-        new_data = []
-        for row1 in t1["data"]:
-            join_val = row1[t1_col_idx]
-            for row2 in t2["data"]:
-                if row2[t2_col_idx] == join_val:
-                    new_row = row1 + [
-                        row2[i] for i in range(len(row2)) if t2["header"][i] != col_name
-                    ]
-                    new_data.append(new_row)
+        new_data = self.filter_join(t1, t1["data"], t2, t2["data"], col_name, condition)
 
         # Create the new table
         self.tables[new_table] = {"header": new_header, "data": new_data}
 
         return f"Table '{new_table}' created by joining '{table1}' and '{table2}' on '{col_name}'."
 
+    def filter_join(self, t1, data1, t2, data2, col_name, condition):
+        """Join rows of two tables keeping only the joined rows matching a
+        condition, filtering each side before the join where possible.
+        """
+        if not condition:
+            return self.join_rows(t1, data1, t2, data2, col_name)
+
+        condition1, condition2, residual = split_join_condition(
+            t1["header"], t2["header"], col_name, condition
+        )
+        if condition1:
+            data1 = self.filter_by_condition(data1, t1["header"], condition1)
+        if condition2:
+            data2 = self.filter_by_condition(data2, t2["header"], condition2)
+
+        new_data = self.join_rows(t1, data1, t2, data2, col_name)
+        if residual:
+            new_header = t1["header"] + [col for col in t2["header"] if col != col_name]
+            new_data = self.filter_by_condition(new_data, new_header, residual)
+        return new_data
+
+    def join_rows(self, t1, data1, t2, data2, col_name):
+        """Join rows of table t1 with rows of table t2 on a common column."""
+        new_data = []
+        for i, j in self.join_pairs(t1, data1, t2, data2, col_name):
+            row1, row2 = data1[i], data2[j]
+            new_row = row1 + [
+                row2[k] for k in range(len(row2)) if t2["header"][k] != col_name
+            ]
+            new_data.append(new_row)
+        return new_data
+
+    def join_pairs(self, t1, data1, t2, data2, col_name):
+        """Return the (row1, row2) index pairs of rows of tables t1 and t2 with
+        equal values in a common column.
+        """
+        col_idx1 = t1["header"].index(col_name)
+        col_idx2 = t2["header"].index(col_name)
+
+        # Large tables are probed in partitions in parallel
+        if self.executor.enabled_for(len(data1)):
+            return self.executor.join_pairs(
+                data1,
+                col_idx1,
+                data2,
+                col_idx2,
+                self.shared_rows(data1, t1["header"]),
+                self.shared_rows(data2, t2["header"]),
+            )
+
+        pairs = []
+        for i, row1 in enumerate(data1):
+            join_val = row1[col_idx1]
+            for j, row2 in enumerate(data2):
+                if row2[col_idx2] == join_val:
+                    pairs.append((i, j))
+        return pairs
+
+    # Materialized tables implementation
+    def create_materialized(self, definition):
+        """Create a table that is kept up to date with the tables it reads.
+
+        definition is the CREATE_SELECT or CREATE_JOIN command building it.
+        """
+        new_table = definition[1]
+        if new_table in self.tables:
+            return f"Error: Table '{new_table}' already exists."
+
+        result = self.execute_command(definition)
+        if new_table in self.tables:
+            self.tables[new_table]["definition"] = definition
+        return result
+
+    def dependents(self, table_name):
+        """Return the names of the materialized tables defined over a table."""
+        names = []
+        for name, table in self.tables.items():
+            definition = table.get("definition")
+            if definition is None or name == table_name:
+                continue
+            if definition[0] == "CREATE_SELECT" and definition[3] == table_name:
+                names.append(name)
+            elif definition[0] == "CREATE_JOIN" and table_name in definition[2:4]:
+                names.append(name)
+        return names
+
+    def materialize_delta(self, derived_name, base_name, rows):
+        """Return the rows of a materialized table produced by rows just
+        appended to one of its base tables.
+
+        Rows appended to the right side of a join are joined with the whole
+        left table and added at the end, so the row order can differ from a
+        full rebuild.
+
+        Returns None when the definition no longer applies to the base tables.
+        """
+        definition = self.tables[derived_name]["definition"]
+        if self.check_definition(definition):
+            return None
+
+        if definition[0] == "CREATE_SELECT":
+            columns, condition = definition[2], definition[4]
+            header = self.tables[base_name]["header"]
+            if condition:
+                rows = self.filter_by_condition(rows, header, condition)
+            if columns == "*":
+                return list(rows)
+            col_indices = [header.index(col) for col in columns]
+            return [[row[i] for i in col_indices] for row in rows]
+
+        table1, table2, col_name, condition = definition[2:6]
+        if table1 not in self.tables or table2 not in self.tables:
+            return []
+        t1, t2 = self.tables[table1], self.tables[table2]
+        delta = []
+        if base_name == table1:
+            delta += self.filter_join(t1, rows, t2, t2["data"], col_name, condition)
+        if base_name == table2:
+            data1 = t1["data"]
+            if table1 == table2:
+                # New rows were already joined with each other above
+                data1 = data1[: len(data1) - len(rows)]
+            delta += self.filter_join(t1, data1, t2, rows, col_name, condition)
+        return delta
+
+    def check_definition(self, definition):
+        """Return an error message if a table or column read by the definition
+        of a materialized table no longer exists, or None.
+        """
+        if definition[0] == "CREATE_SELECT":
+            columns, table_name, condition = definition[2], definition[3], definition[4]
+            required = {table_name: [] if columns == "*" else referenced_columns(columns)}
+        else:
+            table1, table2, col_name, condition = definition[2:6]
+            required = {table1: [col_name], table2: [col_name]}
+
+        for table_name in required:
+            if table_name not in self.tables:
+                return f"Error: Table '{table_name}' does not exist."
+        # Join conditions may read columns of either table
+        columns = condition_columns(condition) if condition else []
+        headers = [self.tables[table_name]["header"] for table_name in required]
+        for col in columns:
+            if not any(col in header for header in headers):
+                return f"Error: Column '{col}' does not exist."
+        for table_name, columns in required.items():
+            header = self.tables[table_name]["header"]
+            for col in columns:
+                if col not in header:
+                    return (
+                        f"Error: Column '{col}' does not exist in table '{table_name}'."
+                    )
+        return None
+
+    def rebuild_materialized(self, table_name):
+        """Recompute a materialized table from its definition."""
+        table = self.tables[table_name]
+        definition = (table["definition"][0], table_name) + table["definition"][2:]
+
+        del self.tables[table_name]
+        result = self.execute_command(definition)
+        if table_name not in self.tables:
+            # Keep the previous contents when the definition no longer
+            # applies, as a plain table that is no longer kept up to date
+            del table["definition"]
+            self.tables[table_name] = table
+            return result
+
+        self.tables[table_name]["definition"] = definition
+        self.rebuild_dependents(table_name)
+        return f"Table '{table_name}' refreshed successfully."
+
+    def rebuild_dependents(self, table_name):
+        """Recompute the materialized tables defined over a replaced table."""
+        for derived_name in self.dependents(table_name):
+            self.rebuild_materialized(derived_name)
+
     # Procedure commands implementation
     def define_procedure(self, proc_name, commands):
         """Define a procedure with a list of commands."""
@@ -5,10 +5,15 @@ class Lexer:
     # Reserved words
     reserved = {
         "import": "IMPORT",
+        "append": "APPEND",
+        "refresh": "REFRESH",
         "table": "TABLE",
+        "tables": "TABLES",
         "from": "FROM",
         "export": "EXPORT",
         "as": "AS",
+        "to": "TO",
+        "compression": "COMPRESSION",
         "discard": "DISCARD",
         "rename": "RENAME",
         "print": "PRINT",
@@ -16,6 +21,7 @@ class Lexer:
         "where": "WHERE",
         "limit": "LIMIT",
         "create": "CREATE",
+        "materialized": "MATERIALIZED",
         "join": "JOIN",
         "using": "USING",
         "procedure": "PROCEDURE",
@@ -23,6 +29,13 @@ class Lexer:
         "end": "END",
         "call": "CALL",
         "and": "AND",
+        "within": "WITHIN",
+        "nearest": "NEAREST",
+        "over": "OVER",
+        "partition": "PARTITION",
+        "order": "ORDER",
+        "by": "BY",
+        "range": "RANGE",
     }
 
     # Token list
@@ -30,6 +43,7 @@ class Lexer:
         "ID",
         "STRING",
         "NUMBER",
+        "FLOAT",
         "ASTERISK",
         "COMMA",
         "EQUALS",
@@ -41,6 +55,9 @@ class Lexer:
         "SINGLE_COMMENT",
         "MULTI_COMMENT",
         "SEMICOLON",
+        "LPAREN",
+        "RPAREN",
+        "MINUS",
     ] + list(reserved.values())
 
     # Simple rules for tokens
@@ -53,6 +70,9 @@ class Lexer:
     t_LESS_EQUALS = r"<="
     t_GREATER_EQUALS = r">="
     t_SEMICOLON = r";"
+    t_LPAREN = r"\("
+    t_RPAREN = r"\)"
+    t_MINUS = r"-"
 
     # Ignored characters
     t_ignore = " \t"
@@ -63,6 +83,11 @@ class Lexer:
         t.value = t.value[1:-1]  # Remove quotes
         return t
 
+    # Decimal number rule, the text is kept as written
+    def t_FLOAT(self, t):
+        r"\d+\.\d+"
+        return t
+
     # Number rule
     def t_NUMBER(self, t):
         r"\d+"
@@ -0,0 +1,205 @@
+import os
+import pickle
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from conditions import bind, matches
+
+# Build side of the most recent join, cached per worker process
+_build_cache = {}
+# Partitions unpickled from the most recently read shared block, cached per
+# worker process: a block holds the same rows for as long as it exists
+_rows_cache = {"name": None, "partitions": {}}
+
+
+def _load_slice(name, offset, length):
+    """Unpickle one partition stored in a shared memory block."""
+    # Workers share the parent's resource tracker, the parent unlinks the block
+    shm = shared_memory.SharedMemory(name=name)
+    view = shm.buf[offset : offset + length]
+    try:
+        return pickle.loads(view)
+    finally:
+        view.release()
+        shm.close()
+
+
+def _load_partition(name, offset, length):
+    """Return the rows of one partition, unpickling them once per worker."""
+    if _rows_cache["name"] != name:
+        _rows_cache["name"] = name
+        _rows_cache["partitions"] = {}
+    partitions = _rows_cache["partitions"]
+    if offset not in partitions:
+        partitions[offset] = _load_slice(name, offset, length)
+    return partitions[offset]
+
+
+def _filter_partition(name, offset, length, start, header, condition):
+    """Return the global indices of the rows of a partition matching a condition."""
+    rows = _load_partition(name, offset, length)
+    bound = bind(condition, header)
+    return [start + i for i, row in enumerate(rows) if matches(row, bound)]
+
+
+def _join_partition(name, offset, length, start, probe_idx, build, build_idx):
+    """Return the (probe, build) row index pairs of a partition with equal keys."""
+    rows = _load_partition(name, offset, length)
+    build_name, build_partitions = build
+
+    key = (build_name, build_idx)
+    if key not in _build_cache:
+        _build_cache.clear()
+        buckets = {}
+        for build_offset, build_length, build_start in build_partitions:
+            build_rows = _load_slice(build_name, build_offset, build_length)
+            for j, row in enumerate(build_rows, build_start):
+                buckets.setdefault(row[build_idx], []).append(j)
+        _build_cache[key] = buckets
+    buckets = _build_cache[key]
+
+    pairs = []
+    for i, row in enumerate(rows):
+        for j in buckets.get(row[probe_idx], ()):
+            pairs.append((start + i, j))
+    return pairs
+
+
+def _release(shm):
+    shm.close()
+    shm.unlink()
+
+
+class SharedRows:
+    """Rows pickled once into a shared memory block, split in partitions.
+
+    The block is released by close(), or when the object is garbage collected.
+    """
+
+    def __init__(self, rows, partitions=1):
+        size = max(1, -(-len(rows) // partitions))
+        chunks = [
+            (start, pickle.dumps(rows[start : start + size], pickle.HIGHEST_PROTOCOL))
+            for start in range(0, len(rows), size)
+        ] or [(0, pickle.dumps([], pickle.HIGHEST_PROTOCOL))]
+
+        self.shm = shared_memory.SharedMemory(
+            create=True, size=sum(len(blob) for _, blob in chunks)
+        )
+        # (offset, length, start row) of each partition
+        self.partitions = []
+        offset = 0
+        for start, blob in chunks:
+            self.shm.buf[offset : offset + len(blob)] = blob
+            self.partitions.append((offset, len(blob), start))
+            offset += len(blob)
+        self.name = self.shm.name
+        self.count = len(rows)
+        self._finalizer = weakref.finalize(self, _release, self.shm)
+
+    def close(self):
+        """Release the shared memory block."""
+        self._finalizer()
+
+
+class PartitionedExecutor:
+    """Run filters and join probes over partitions of a table in a process pool."""
+
+    def __init__(self, parallelism=None, threshold=100000):
+        self.parallelism = parallelism or os.cpu_count() or 1
+        self.threshold = threshold
+        self.pool = None
+
+    def enabled_for(self, row_count):
+        """Check whether a table of this size should be partitioned."""
+        return self.parallelism > 1 and row_count >= self.threshold
+
+    def _submit(self, fn, *args):
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.parallelism)
+        return self.pool.submit(fn, *args)
+
+    def share(self, rows):
+        """Copy rows to shared memory, in one partition per worker process.
+
+        The result can be passed to filter_indices() and join_pairs() for as
+        long as the rows do not change, so they are only pickled once.
+        """
+        return SharedRows(rows, self.parallelism)
+
+    def filter_indices(self, data, header, condition, shared=None):
+        """Return the indices of the rows matching a condition, in row order.
+
+        shared is the result of share() for data; without it data is copied
+        to shared memory for this call only.
+        """
+        owned = []
+        if shared is None:
+            shared = self.share(data)
+            owned.append(shared)
+        try:
+            futures = [
+                self._submit(
+                    _filter_partition,
+                    shared.name,
+                    offset,
+                    length,
+                    start,
+                    header,
+                    condition,
+                )
+                for offset, length, start in shared.partitions
+            ]
+            result = []
+            for future in futures:
+                result.extend(future.result())
+            return result
+        finally:
+            for block in owned:
+                block.close()
+
+    def join_pairs(
+        self, probe, probe_idx, build, build_idx, shared_probe=None, shared_build=None
+    ):
+        """Return the matching (probe, build) index pairs of an equi-join.
+
+        Pairs are ordered as a nested loop over the probe side would produce them.
+        shared_probe and shared_build are the results of share() for each side,
+        as in filter_indices().
+        """
+        owned = []
+        if shared_probe is None:
+            shared_probe = self.share(probe)
+            owned.append(shared_probe)
+        if shared_build is None:
+            shared_build = self.share(build)
+            owned.append(shared_build)
+        try:
+            build_ref = (shared_build.name, shared_build.partitions)
+            futures = [
+                self._submit(
+                    _join_partition,
+                    shared_probe.name,
+                    offset,
+                    length,
+                    start,
+                    probe_idx,
+                    build_ref,
+                    build_idx,
+                )
+                for offset, length, start in shared_probe.partitions
+            ]
+            result = []
+            for future in futures:
+                result.extend(future.result())
+            return result
+        finally:
+            for block in owned:
+                block.close()
+
+    def shutdown(self):
+        """Stop the worker processes."""
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
@@ -1,3 +1,6 @@
+import hashlib
+import inspect
+import sys
 import ply.yacc as yacc
 from lexer import Lexer
 
@@ -10,6 +13,8 @@ class Parser:
         self.tokens = self.lexer.tokens
         self.lexer.build()
         self.parser = yacc.yacc(module=self)
+        # Number of syntax errors found by the last parse
+        self.errors = 0
 
     # Start symbol for the grammar
     def p_program(self, p):
@@ -35,16 +40,30 @@ class Parser:
         | export_command
         | discard_command
         | rename_command
-        | print_command"""
+        | print_command
+        | refresh_command"""
         p[0] = p[1]
 
     def p_import_command(self, p):
-        """import_command : IMPORT TABLE ID FROM STRING SEMICOLON"""
-        p[0] = ("IMPORT", p[3], p[5])
+        """import_command : IMPORT TABLE ID FROM STRING SEMICOLON
+        | IMPORT TABLE ID FROM STRING APPEND SEMICOLON"""
+        p[0] = ("IMPORT", p[3], p[5], len(p) == 8)
 
     def p_export_command(self, p):
-        """export_command : EXPORT TABLE ID AS STRING SEMICOLON"""
-        p[0] = ("EXPORT", p[3], p[5])
+        """export_command : EXPORT TABLE ID AS STRING SEMICOLON
+        | EXPORT TABLE ID AS STRING COMPRESSION ID SEMICOLON"""
+        if len(p) == 7:
+            p[0] = ("EXPORT", p[3], p[5], None)
+        else:
+            p[0] = ("EXPORT", p[3], p[5], p[7])
+
+    def p_export_tables_command(self, p):
+        """export_command : EXPORT TABLES id_list TO STRING SEMICOLON
+        | EXPORT TABLES id_list TO STRING COMPRESSION ID SEMICOLON"""
+        if len(p) == 7:
+            p[0] = ("EXPORT_TABLES", p[3], p[5], None)
+        else:
+            p[0] = ("EXPORT_TABLES", p[3], p[5], p[7])
 
     def p_discard_command(self, p):
         """discard_command : DISCARD TABLE ID SEMICOLON"""
@@ -58,6 +77,10 @@ class Parser:
         """print_command : PRINT TABLE ID SEMICOLON"""
         p[0] = ("PRINT", p[3])
 
+    def p_refresh_command(self, p):
+        """refresh_command : REFRESH TABLE ID SEMICOLON"""
+        p[0] = ("REFRESH", p[3])
+
     # Query commands
     def p_query_command(self, p):
         """query_command : select_command
@@ -84,9 +107,39 @@ class Parser:
 
     def p_select_list(self, p):
         """select_list : ASTERISK
-        | id_list"""
+        | select_items"""
         p[0] = p[1]
 
+    def p_select_items(self, p):
+        """select_items : select_item
+        | select_items COMMA select_item"""
+        if len(p) == 2:
+            p[0] = [p[1]]
+        else:
+            p[0] = p[1] + [p[3]]
+
+    def p_select_item(self, p):
+        """select_item : ID
+        | window"""
+        p[0] = p[1]
+
+    def p_window(self, p):
+        """window : ID LPAREN ID RPAREN OVER LPAREN PARTITION BY ID ORDER BY ID RANGE window_range RPAREN
+        | ID LPAREN ID RPAREN OVER LPAREN ORDER BY ID RANGE window_range RPAREN"""
+        if len(p) == 16:
+            partition, order, size = p[9], p[12], p[14]
+        else:
+            partition, order, size = None, p[9], p[11]
+        p[0] = ("WINDOW", p[1].upper(), p[3], partition, order) + size
+
+    def p_window_range(self, p):
+        """window_range : NUMBER
+        | FLOAT
+        | NUMBER ID
+        | FLOAT ID"""
+        unit = p[2].upper() if len(p) == 3 else None
+        p[0] = (float(p[1]), unit)
+
     def p_id_list(self, p):
         """id_list : ID
         | id_list COMMA ID"""
@@ -108,29 +161,72 @@ class Parser:
         elif len(p) == 4 and p[2] == "AND":
             p[0] = ("AND", p[1], p[3])
 
+    def p_within_condition(self, p):
+        """condition : WITHIN LPAREN ID COMMA number COMMA number COMMA number COMMA number RPAREN"""
+        p[0] = ("WITHIN", p[3], p[5], p[7], p[9], p[11])
+
+    def p_nearest_condition(self, p):
+        """condition : ID NEAREST NUMBER TO LPAREN number COMMA number RPAREN"""
+        p[0] = ("NEAREST", p[1], p[3], p[6], p[8])
+
     def p_value(self, p):
         """value : ID
         | STRING
-        | NUMBER"""
-        p[0] = p[1]
+        | NUMBER
+        | FLOAT
+        | MINUS NUMBER
+        | MINUS FLOAT"""
+        if len(p) == 2:
+            p[0] = p[1]
+        else:
+            p[0] = f"-{p[2]}"
+
+    def p_number(self, p):
+        """number : NUMBER
+        | FLOAT
+        | MINUS NUMBER
+        | MINUS FLOAT"""
+        if len(p) == 2:
+            p[0] = float(p[1])
+        else:
+            p[0] = -float(p[2])
 
     # Create commands
     def p_create_command(self, p):
         """create_command : create_select_command
-        | create_join_command"""
+        | create_join_command
+        | create_materialized_command"""
         p[0] = p[1]
 
     def p_create_select_command(self, p):
         """create_select_command : CREATE TABLE ID SELECT select_list FROM ID WHERE condition SEMICOLON
         | CREATE TABLE ID SELECT select_list FROM ID SEMICOLON"""
-        if len(p) == 10:
+        if len(p) == 9:
             p[0] = ("CREATE_SELECT", p[3], p[5], p[7], None)
         else:
             p[0] = ("CREATE_SELECT", p[3], p[5], p[7], p[9])
 
     def p_create_join_command(self, p):
-        """create_join_command : CREATE TABLE ID FROM ID JOIN ID USING ID SEMICOLON"""
-        p[0] = ("CREATE_JOIN", p[3], p[5], p[7], p[9])
+        """create_join_command : CREATE TABLE ID FROM ID JOIN ID USING ID SEMICOLON
+        | CREATE TABLE ID FROM ID JOIN ID USING ID WHERE condition SEMICOLON"""
+        if len(p) == 11:
+            p[0] = ("CREATE_JOIN", p[3], p[5], p[7], p[9], None)
+        else:
+            p[0] = ("CREATE_JOIN", p[3], p[5], p[7], p[9], p[11])
+
+    def p_create_materialized_command(self, p):
+        """create_materialized_command : CREATE MATERIALIZED TABLE ID SELECT select_list FROM ID WHERE condition SEMICOLON
+        | CREATE MATERIALIZED TABLE ID SELECT select_list FROM ID SEMICOLON
+        | CREATE MATERIALIZED TABLE ID FROM ID JOIN ID USING ID SEMICOLON
+        | CREATE MATERIALIZED TABLE ID FROM ID JOIN ID USING ID WHERE condition SEMICOLON"""
+        if p.slice[5].type == "FROM":
+            condition = p[12] if len(p) == 14 else None
+            definition = ("CREATE_JOIN", p[4], p[6], p[8], p[10], condition)
+        elif len(p) == 10:
+            definition = ("CREATE_SELECT", p[4], p[6], p[8], None)
+        else:
+            definition = ("CREATE_SELECT", p[4], p[6], p[8], p[10])
+        p[0] = ("CREATE_MATERIALIZED", definition)
 
     # Procedure commands
     def p_procedure_command(self, p):
@@ -152,6 +248,7 @@ class Parser:
 
     # Error rule for syntax errors
     def p_error(self, p):
+        self.errors += 1
         if p:
             print(f"Syntax error at '{p.value}', line {p.lineno}")
         else:
@@ -159,4 +256,14 @@ class Parser:
 
     # Parse the input
     def parse(self, data):
+        self.errors = 0
         return self.parser.parse(data, lexer=self.lexer.lexer)
+
+    # Identify the grammar and the actions building the AST, so cached parse
+    # results can be invalidated: any change to the parser or lexer source
+    # gives a new version
+    def grammar_version(self):
+        digest = hashlib.sha256()
+        for obj in (self, self.lexer):
+            digest.update(inspect.getsource(sys.modules[type(obj).__module__]).encode())
+        return digest.hexdigest()[:16]
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'AND AS ASTERISK CALL COMMA CREATE DISCARD DO END EQUALS EXPORT FROM GREATER_EQUALS GREATER_THAN ID IMPORT JOIN LESS_EQUALS LESS_THAN LIMIT MULTI_COMMENT NOT_EQUALS NUMBER PRINT PROCEDURE RENAME SELECT SEMICOLON SINGLE_COMMENT STRING TABLE USING WHEREprogram : command\n        | program commandcommand : table_command\n        | query_command\n        | create_command\n        | procedure_command\n        | call_commandtable_command : import_command\n        | export_command\n        | discard_command\n        | rename_command\n        | print_commandimport_command : IMPORT TABLE ID FROM STRING SEMICOLONexport_command : EXPORT TABLE ID AS STRING SEMICOLONdiscard_command : DISCARD TABLE ID SEMICOLONrename_command : RENAME TABLE ID ID SEMICOLONprint_command : PRINT TABLE ID SEMICOLONquery_command : select_command\n        | select_where_command\n        | select_limit_command\n        | select_where_limit_commandselect_command : SELECT select_list FROM ID SEMICOLONselect_where_command : SELECT select_list FROM ID WHERE condition SEMICOLONselect_limit_command : SELECT select_list FROM ID LIMIT NUMBER SEMICOLONselect_where_limit_command : SELECT select_list FROM ID WHERE condition LIMIT NUMBER SEMICOLONselect_list : ASTERISK\n        | id_listid_list : ID\n        | id_list COMMA IDcondition : ID EQUALS value\n        | ID NOT_EQUALS value\n        | ID LESS_THAN value\n        | ID GREATER_THAN value\n        | ID LESS_EQUALS value\n        | ID GREATER_EQUALS value\n        | condition AND conditionvalue : ID\n        | STRING\n        | NUMBERcreate_command : create_select_command\n        | create_join_commandcreate_select_command : CREATE TABLE ID SELECT select_list FROM ID WHERE condition SEMICOLON\n        | CREATE TABLE ID SELECT select_list FROM ID SEMICOLONcreate_join_command : CREATE TABLE ID FROM ID JOIN ID USING ID SEMICOLONprocedure_command : PROCEDURE ID DO procedure_body ENDprocedure_body : command\n        | procedure_body commandcall_command : CALL ID SEMICOLON'
+_lr_signature = 'AND APPEND AS ASTERISK BY CALL COMMA COMPRESSION CREATE DISCARD DO END EQUALS EXPORT FLOAT FROM GREATER_EQUALS GREATER_THAN ID IMPORT JOIN LESS_EQUALS LESS_THAN LIMIT LPAREN MATERIALIZED MINUS MULTI_COMMENT NEAREST NOT_EQUALS NUMBER ORDER OVER PARTITION PRINT PROCEDURE RANGE REFRESH RENAME RPAREN SELECT SEMICOLON SINGLE_COMMENT STRING TABLE TABLES TO USING WHERE WITHINprogram : command\n        | program commandcommand : table_command\n        | query_command\n        | create_command\n        | procedure_command\n        | call_commandtable_command : import_command\n        | export_command\n        | discard_command\n        | rename_command\n        | print_command\n        | refresh_commandimport_command : IMPORT TABLE ID FROM STRING SEMICOLON\n        | IMPORT TABLE ID FROM STRING APPEND SEMICOLONexport_command : EXPORT TABLE ID AS STRING SEMICOLON\n        | EXPORT TABLE ID AS STRING COMPRESSION ID SEMICOLONexport_command : EXPORT TABLES id_list TO STRING SEMICOLON\n        | EXPORT TABLES id_list TO STRING COMPRESSION ID SEMICOLONdiscard_command : DISCARD TABLE ID SEMICOLONrename_command : RENAME TABLE ID ID SEMICOLONprint_command : PRINT TABLE ID SEMICOLONrefresh_command : REFRESH TABLE ID SEMICOLONquery_command : select_command\n        | select_where_command\n        | select_limit_command\n        | select_where_limit_commandselect_command : SELECT select_list FROM ID SEMICOLONselect_where_command : SELECT select_list FROM ID WHERE condition SEMICOLONselect_limit_command : SELECT select_list FROM ID LIMIT NUMBER SEMICOLONselect_where_limit_command : SELECT select_list FROM ID WHERE condition LIMIT NUMBER SEMICOLONselect_list : ASTERISK\n        | select_itemsselect_items : select_item\n        | select_items COMMA select_itemselect_item : ID\n        | windowwindow : ID LPAREN ID RPAREN OVER LPAREN PARTITION BY ID ORDER BY ID RANGE window_range RPAREN\n        | ID LPAREN ID RPAREN OVER LPAREN ORDER BY ID RANGE window_range RPARENwindow_range : NUMBER\n        | FLOAT\n        | NUMBER ID\n        | FLOAT IDid_list : ID\n        | id_list COMMA IDcondition : ID EQUALS value\n        | ID NOT_EQUALS value\n        | ID LESS_THAN value\n        | ID GREATER_THAN value\n        | ID LESS_EQUALS value\n        | ID GREATER_EQUALS value\n        | condition AND conditioncondition : WITHIN LPAREN ID COMMA number COMMA number COMMA number COMMA number RPARENcondition : ID NEAREST NUMBER TO LPAREN number COMMA number RPARENvalue : ID\n        | STRING\n        | NUMBER\n        | FLOAT\n        | MINUS NUMBER\n        | MINUS FLOATnumber : NUMBER\n        | FLOAT\n        | MINUS NUMBER\n        | MINUS FLOATcreate_command : create_select_command\n        | create_join_command\n        | create_materialized_commandcreate_select_command : CREATE TABLE ID SELECT select_list FROM ID WHERE condition SEMICOLON\n        | CREATE TABLE ID SELECT select_list FROM ID SEMICOLONcreate_join_command : CREATE TABLE ID FROM ID JOIN ID USING ID SEMICOLON\n        | CREATE TABLE ID FROM ID JOIN ID USING ID WHERE condition SEMICOLONcreate_materialized_command : CREATE MATERIALIZED TABLE ID SELECT select_list FROM ID WHERE condition SEMICOLON\n        | CREATE MATERIALIZED TABLE ID SELECT select_list FROM ID SEMICOLON\n        | CREATE MATERIALIZED TABLE ID FROM ID JOIN ID USING ID SEMICOLON\n        | CREATE MATERIALIZED TABLE ID FROM ID JOIN ID USING ID WHERE condition SEMICOLONprocedure_command : PROCEDURE ID DO procedure_body ENDprocedure_body : command\n        | procedure_body commandcall_command : CALL ID SEMICOLON'
     
-_lr_action_items = {'PROCEDURE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,28,41,42,51,52,55,57,62,63,66,67,72,73,85,88,103,105,108,109,],[19,19,-1,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-18,-19,-20,-21,-40,-41,-2,19,-48,19,-46,-15,-17,-45,-47,-16,-22,-13,-14,-23,-24,-43,-25,-42,-44,]),'CALL':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,28,41,42,51,52,55,57,62,63,66,67,72,73,85,88,103,105,108,109,],[20,20,-1,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-18,-19,-20,-21,-40,-41,-2,20,-48,20,-46,-15,-17,-45,-47,-16,-22,-13,-14,-23,-24,-43,-25,-42,-44,]),'IMPORT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,28,41,42,51,52,55,57,62,63,66,67,72,73,85,88,103,105,108,109,],[21,21,-1,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-18,-19,-20,-21,-40,-41,-2,21,-48,21,-46,-15,-17,-45,-47,-16,-22,-13,-14,-23,-24,-43,-25,-42,-44,]),'EXPORT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,28,41,42,51,52,55,57,62,63,66,67,72,73,85,88,103,105,108,109,],[22,22,-1,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-18,-19,-20,-21,-40,-41,-2,22,-48,22,-46,-15,-17,-45,-47,-16,-22,-13,-14,-23,-24,-43,-25,-42,-44,]),'DISCARD':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,28,41,42,51,52,55,57,62,63,66,67,72,73,85,88,103,105,108,109,],[23,23,-1,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-18,-19,-20,-21,-40,-41,-2,23,-48,23,-46,-15,-17,-45,-47,-16,-22,-13,-14,-23,-24,-43,-25,-42,-44,]),'RENAME':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,28,41,42,51,52,55,57,62,63,66,67,72,73,85,88,103,105,108,109,],[24,24,-1,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-18,-19,-20,-21,-40,-41,-2,24,-48,24,-46,-15,-17,-45,-47,-16,-22,-13,-14,-23,-24,-43,-25,-42,-44,]),'PRINT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,28,41,42,51,52,55,57,62,63,66,67,72,73,85,88,103,105,108,109,],[25,25,-1,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-18,-19,-20,-21,-40,-41,-2,25,-48,25,-46,-15,-17,-45,-47,-16,-22,-13,-14,-23,-24,-43,-25,-42,-44,]),'SELECT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,28,41,42,50,51,52,55,57,62,63,66,67,72,73,85,88,103,105,108,109,],[26,26,-1,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-18,-19,-20,-21,-40,-41,-2,26,-48,60,26,-46,-15,-17,-45,-47,-16,-22,-13,-14,-23,-24,-43,-25,-42,-44,]),'CREATE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,28,41,42,51,52,55,57,62,63,66,67,72,73,85,88,103,105,108,109,],[27,27,-1,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-18,-19,-20,-21,-40,-41,-2,27,-48,27,-46,-15,-17,-45,-47,-16,-22,-13,-14,-23,-24,-43,-25,-42,-44,]),'$end':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,28,42,55,57,62,66,67,72,73,85,88,103,105,108,109,],[0,-1,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-18,-19,-20,-21,-40,-41,-2,-48,-15,-17,-45,-16,-22,-13,-14,-23,-24,-43,-25,-42,-44,]),'END':([3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,42,51,52,55,57,62,63,66,67,72,73,85,88,103,105,108,109,],[-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-18,-19,-20,-21,-40,-41,-48,62,-46,-15,-17,-45,-47,-16,-22,-13,-14,-23,-24,-43,-25,-42,-44,]),'ID':([19,20,26,31,32,33,34,35,40,46,48,49,60,61,68,77,78,79,80,81,82,83,84,87,102,104,],[29,30,37,43,44,45,46,47,50,56,58,59,37,71,74,89,90,91,91,91,91,91,91,74,74,107,]),'TABLE':([21,22,23,24,25,27,],[31,32,33,34,35,40,]),'ASTERISK':([26,60,],[38,38,]),'DO':([29,],[41,]),'SEMICOLON':([30,45,47,56,58,64,65,75,76,89,91,92,93,94,95,96,97,98,99,100,101,106,107,],[42,55,57,66,67,72,73,85,88,103,-37,-30,-38,-39,-31,-32,-33,-34,-35,105,-36,108,109,]),'FROM':([36,37,38,39,43,50,59,70,],[48,-28,-26,-27,53,61,-29,77,]),'COMMA':([37,39,59,],[-28,49,-29,]),'AS':([44,],[54,]),'STRING':([53,54,79,80,81,82,83,84,],[64,65,93,93,93,93,93,93,]),'WHERE':([58,89,],[68,102,]),'LIMIT':([58,75,91,92,93,94,95,96,97,98,99,101,],[69,86,-37,-30,-38,-39,-31,-32,-33,-34,-35,-36,]),'NUMBER':([69,79,80,81,82,83,84,86,],[76,94,94,94,94,94,94,100,]),'JOIN':([71,],[78,]),'EQUALS':([74,],[79,]),'NOT_EQUALS':([74,],[80,]),'LESS_THAN':([74,],[81,]),'GREATER_THAN':([74,],[82,]),'LESS_EQUALS':([74,],[83,]),'GREATER_EQUALS':([74,],[84,]),'AND':([75,91,92,93,94,95,96,97,98,99,101,106,],[87,-37,-30,-38,-39,-31,-32,-33,-34,-35,87,87,]),'USING':([90,],[104,]),}
+_lr_action_items = {'PROCEDURE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,31,49,50,64,65,70,72,73,80,81,86,87,95,97,99,110,120,124,130,131,150,157,164,173,174,185,186,194,202,],[21,21,-1,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-24,-25,-26,-27,-65,-66,-67,-2,21,-79,21,-77,-20,-22,-23,-76,-78,-21,-28,-14,-16,-18,-15,-29,-30,-17,-19,-69,-31,-73,-68,-70,-72,-74,-71,-75,]),'CALL':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,31,49,50,64,65,70,72,73,80,81,86,87,95,97,99,110,120,124,130,131,150,157,164,173,174,185,186,194,202,],[22,22,-1,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-24,-25,-26,-27,-65,-66,-67,-2,22,-79,22,-77,-20,-22,-23,-76,-78,-21,-28,-14,-16,-18,-15,-29,-30,-17,-19,-69,-31,-73,-68,-70,-72,-74,-71,-75,]),'IMPORT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,31,49,50,64,65,70,72,73,80,81,86,87,95,97,99,110,120,124,130,131,150,157,164,173,174,185,186,194,202,],[23,23,-1,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-24,-25,-26,-27,-65,-66,-67,-2,23,-79,23,-77,-20,-22,-23,-76,-78,-21,-28,-14,-16,-18,-15,-29,-30,-17,-19,-69,-31,-73,-68,-70,-72,-74,-71,-75,]),'EXPORT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,31,49,50,64,65,70,72,73,80,81,86,87,95,97,99,110,120,124,130,131,150,157,164,173,174,185,186,194,202,],[24,24,-1,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-24,-25,-26,-27,-65,-66,-67,-2,24,-79,24,-77,-20,-22,-23,-76,-78,-21,-28,-14,-16,-18,-15,-29,-30,-17,-19,-69,-31,-73,-68,-70,-72,-74,-71,-75,]),'DISCARD':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,31,49,50,64,65,70,72,73,80,81,86,87,95,97,99,110,120,124,130,131,150,157,164,173,174,185,186,194,202,],[25,25,-1,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-24,-25,-26,-27,-65,-66,-67,-2,25,-79,25,-77,-20,-22,-23,-76,-78,-21,-28,-14,-16,-18,-15,-29,-30,-17,-19,-69,-31,-73,-68,-70,-72,-74,-71,-75,]),'RENAME':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,31,49,50,64,65,70,72,73,80,81,86,87,95,97,99,110,120,124,130,131,150,157,164,173,174,185,186,194,202,],[26,26,-1,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-24,-25,-26,-27,-65,-66,-67,-2,26,-79,26,-77,-20,-22,-23,-76,-78,-21,-28,-14,-16,-18,-15,-29,-30,-17,-19,-69,-31,-73,-68,-70,-72,-74,-71,-75,]),'PRINT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,31,49,50,64,65,70,72,73,80,81,86,87,95,97,99,110,120,124,130,131,150,157,164,173,174,185,186,194,202,],[27,27,-1,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-24,-25,-26,-27,-65,-66,-67,-2,27,-79,27,-77,-20,-22,-23,-76,-78,-21,-28,-14,-16,-18,-15,-29,-30,-17,-19,-69,-31,-73,-68,-70,-72,-74,-71,-75,]),'REFRESH':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,31,49,50,64,65,70,72,73,80,81,86,87,95,97,99,110,120,124,130,131,150,157,164,173,174,185,186,194,202,],[28,28,-1,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-24,-25,-26,-27,-65,-66,-67,-2,28,-79,28,-77,-20,-22,-23,-76,-78,-21,-28,-14,-16,-18,-15,-29,-30,-17,-19,-69,-31,-73,-68,-70,-72,-74,-71,-75,]),'SELECT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,31,49,50,62,64,65,70,72,73,79,80,81,86,87,95,97,99,110,120,124,130,131,150,157,164,173,174,185,186,194,202,],[29,29,-1,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-24,-25,-26,-27,-65,-66,-67,-2,29,-79,77,29,-77,-20,-22,-23,93,-76,-78,-21,-28,-14,-16,-18,-15,-29,-30,-17,-19,-69,-31,-73,-68,-70,-72,-74,-71,-75,]),'CREATE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,31,49,50,64,65,70,72,73,80,81,86,87,95,97,99,110,120,124,130,131,150,157,164,173,174,185,186,194,202,],[30,30,-1,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-24,-25,-26,-27,-65,-66,-67,-2,30,-79,30,-77,-20,-22,-23,-76,-78,-21,-28,-14,-16,-18,-15,-29,-30,-17,-19,-69,-31,-73,-68,-70,-72,-74,-71,-75,]),'$end':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,31,50,70,72,73,80,86,87,95,97,99,110,120,124,130,131,150,157,164,173,174,185,186,194,202,],[0,-1,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-24,-25,-26,-27,-65,-66,-67,-2,-79,-20,-22,-23,-76,-21,-28,-14,-16,-18,-15,-29,-30,-17,-19,-69,-31,-73,-68,-70,-72,-74,-71,-75,]),'END':([3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,50,64,65,70,72,73,80,81,86,87,95,97,99,110,120,124,130,131,150,157,164,173,174,185,186,194,202,],[-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-24,-25,-26,-27,-65,-66,-67,-79,80,-77,-20,-22,-23,-76,-78,-21,-28,-14,-16,-18,-15,-29,-30,-17,-19,-69,-31,-73,-68,-70,-72,-74,-71,-75,]),'ID':([21,22,29,34,35,36,37,38,39,40,47,56,59,60,61,63,69,77,78,88,93,94,98,100,106,107,113,114,115,116,117,118,122,123,128,129,149,151,159,160,163,165,175,187,190,192,193,],[32,33,42,51,52,54,55,56,57,58,62,71,74,75,42,79,85,42,92,101,42,109,111,112,126,127,132,132,132,132,132,132,101,146,152,153,101,162,171,172,101,177,101,101,198,200,201,]),'TABLE':([23,24,25,26,27,28,30,48,],[34,35,37,38,39,40,47,63,]),'TABLES':([24,],[36,]),'ASTERISK':([29,77,93,],[43,43,43,]),'MATERIALIZED':([30,],[48,]),'DO':([32,],[49,]),'SEMICOLON':([33,55,57,58,71,74,82,83,84,96,102,104,111,112,126,132,133,134,135,136,138,139,140,141,142,144,145,152,154,155,161,162,176,177,184,195,203,210,],[50,70,72,73,86,87,95,97,99,110,120,124,130,131,150,-55,-46,-56,-57,-58,-47,-48,-49,-50,-51,157,-52,164,-59,-60,173,174,185,186,194,202,-54,-53,]),'FROM':([41,42,43,44,45,46,51,62,76,79,91,108,199,209,],[59,-36,-32,-33,-34,-37,66,78,-35,94,106,128,-39,-38,]),'COMMA':([42,44,45,46,53,54,76,85,146,167,168,169,178,180,181,189,199,204,209,],[-36,61,-34,-37,69,-44,-35,-45,158,179,-61,-62,188,-63,-64,197,-39,206,-38,]),'LPAREN':([42,103,105,156,],[60,123,125,166,]),'AS':([52,],[67,]),'TO':([53,54,85,143,],[68,-44,-45,156,]),'STRING':([66,67,68,113,114,115,116,117,118,],[82,83,84,134,134,134,134,134,134,]),'WHERE':([74,126,152,162,177,],[88,149,163,175,187,]),'LIMIT':([74,102,132,133,134,135,136,138,139,140,141,142,145,154,155,203,210,],[89,121,-55,-46,-56,-57,-58,-47,-48,-49,-50,-51,-52,-59,-60,-54,-53,]),'RPAREN':([75,168,169,180,181,191,192,193,196,200,201,207,208,],[90,-61,-62,-63,-64,199,-40,-41,203,-42,-43,209,210,]),'APPEND':([82,],[96,]),'COMPRESSION':([83,84,],[98,100,]),'WITHIN':([88,122,149,163,175,187,],[103,103,103,103,103,103,]),'NUMBER':([89,113,114,115,116,117,118,119,121,137,158,166,170,179,183,188,197,205,206,],[104,135,135,135,135,135,135,143,144,154,168,168,180,168,192,168,168,192,168,]),'OVER':([90,],[105,]),'JOIN':([92,109,],[107,129,]),'EQUALS':([101,],[113,]),'NOT_EQUALS':([101,],[114,]),'LESS_THAN':([101,],[115,]),'GREATER_THAN':([101,],[116,]),'LESS_EQUALS':([101,],[117,]),'GREATER_EQUALS':([101,],[118,]),'NEAREST':([101,],[119,]),'AND':([102,132,133,134,135,136,138,139,140,141,142,145,154,155,161,176,184,195,203,210,],[122,-55,-46,-56,-57,-58,-47,-48,-49,-50,-51,122,-59,-60,122,122,122,122,-54,-53,]),'FLOAT':([113,114,115,116,117,118,137,158,166,170,179,183,188,197,205,206,],[136,136,136,136,136,136,155,169,169,181,169,193,169,169,193,169,]),'MINUS':([113,114,115,116,117,118,158,166,179,188,197,206,],[137,137,137,137,137,137,170,170,170,170,170,170,]),'PARTITION':([125,],[147,]),'ORDER':([125,171,],[148,182,]),'USING':([127,153,],[151,165,]),'BY':([147,148,182,],[159,160,190,]),'RANGE':([172,198,],[183,205,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,],[1,]),'command':([0,1,41,51,],[2,28,52,63,]),'table_command':([0,1,41,51,],[3,3,3,3,]),'query_command':([0,1,41,51,],[4,4,4,4,]),'create_command':([0,1,41,51,],[5,5,5,5,]),'procedure_command':([0,1,41,51,],[6,6,6,6,]),'call_command':([0,1,41,51,],[7,7,7,7,]),'import_command':([0,1,41,51,],[8,8,8,8,]),'export_command':([0,1,41,51,],[9,9,9,9,]),'discard_command':([0,1,41,51,],[10,10,10,10,]),'rename_command':([0,1,41,51,],[11,11,11,11,]),'print_command':([0,1,41,51,],[12,12,12,12,]),'select_command':([0,1,41,51,],[13,13,13,13,]),'select_where_command':([0,1,41,51,],[14,14,14,14,]),'select_limit_command':([0,1,41,51,],[15,15,15,15,]),'select_where_limit_command':([0,1,41,51,],[16,16,16,16,]),'create_select_command':([0,1,41,51,],[17,17,17,17,]),'create_join_command':([0,1,41,51,],[18,18,18,18,]),'select_list':([26,60,],[36,70,]),'id_list':([26,60,],[39,39,]),'procedure_body':([41,],[51,]),'condition':([68,87,102,],[75,101,106,]),'value':([79,80,81,82,83,84,],[92,95,96,97,98,99,]),}
+_lr_goto_items = {'program':([0,],[1,]),'command':([0,1,49,64,],[2,31,65,81,]),'table_command':([0,1,49,64,],[3,3,3,3,]),'query_command':([0,1,49,64,],[4,4,4,4,]),'create_command':([0,1,49,64,],[5,5,5,5,]),'procedure_command':([0,1,49,64,],[6,6,6,6,]),'call_command':([0,1,49,64,],[7,7,7,7,]),'import_command':([0,1,49,64,],[8,8,8,8,]),'export_command':([0,1,49,64,],[9,9,9,9,]),'discard_command':([0,1,49,64,],[10,10,10,10,]),'rename_command':([0,1,49,64,],[11,11,11,11,]),'print_command':([0,1,49,64,],[12,12,12,12,]),'refresh_command':([0,1,49,64,],[13,13,13,13,]),'select_command':([0,1,49,64,],[14,14,14,14,]),'select_where_command':([0,1,49,64,],[15,15,15,15,]),'select_limit_command':([0,1,49,64,],[16,16,16,16,]),'select_where_limit_command':([0,1,49,64,],[17,17,17,17,]),'create_select_command':([0,1,49,64,],[18,18,18,18,]),'create_join_command':([0,1,49,64,],[19,19,19,19,]),'create_materialized_command':([0,1,49,64,],[20,20,20,20,]),'select_list':([29,77,93,],[41,91,108,]),'select_items':([29,77,93,],[44,44,44,]),'select_item':([29,61,77,93,],[45,76,45,45,]),'window':([29,61,77,93,],[46,46,46,46,]),'id_list':([36,],[53,]),'procedure_body':([49,],[64,]),'condition':([88,122,149,163,175,187,],[102,145,161,176,184,195,]),'value':([113,114,115,116,117,118,],[133,138,139,140,141,142,]),'number':([158,166,179,188,197,206,],[167,178,189,196,204,208,]),'window_range':([183,205,],[191,207,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,52 +27,83 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> command','program',1,'p_program','parser.py',14),
-  ('program -> program command','program',2,'p_program','parser.py',15),
-  ('command -> table_command','command',1,'p_command','parser.py',23),
-  ('command -> query_command','command',1,'p_command','parser.py',24),
-  ('command -> create_command','command',1,'p_command','parser.py',25),
-  ('command -> procedure_command','command',1,'p_command','parser.py',26),
-  ('command -> call_command','command',1,'p_command','parser.py',27),
-  ('table_command -> import_command','table_command',1,'p_table_command','parser.py',32),
-  ('table_command -> export_command','table_command',1,'p_table_command','parser.py',33),
-  ('table_command -> discard_command','table_command',1,'p_table_command','parser.py',34),
-  ('table_command -> rename_command','table_command',1,'p_table_command','parser.py',35),
-  ('table_command -> print_command','table_command',1,'p_table_command','parser.py',36),
-  ('import_command -> IMPORT TABLE ID FROM STRING SEMICOLON','import_command',6,'p_import_command','parser.py',40),
-  ('export_command -> EXPORT TABLE ID AS STRING SEMICOLON','export_command',6,'p_export_command','parser.py',44),
-  ('discard_command -> DISCARD TABLE ID SEMICOLON','discard_command',4,'p_discard_command','parser.py',48),
-  ('rename_command -> RENAME TABLE ID ID SEMICOLON','rename_command',5,'p_rename_command','parser.py',52),
-  ('print_command -> PRINT TABLE ID SEMICOLON','print_command',4,'p_print_command','parser.py',56),
-  ('query_command -> select_command','query_command',1,'p_query_command','parser.py',61),
-  ('query_command -> select_where_command','query_command',1,'p_query_command','parser.py',62),
-  ('query_command -> select_limit_command','query_command',1,'p_query_command','parser.py',63),
-  ('query_command -> select_where_limit_command','query_command',1,'p_query_command','parser.py',64),
-  ('select_command -> SELECT select_list FROM ID SEMICOLON','select_command',5,'p_select_command','parser.py',68),
-  ('select_where_command -> SELECT select_list FROM ID WHERE condition SEMICOLON','select_where_command',7,'p_select_where_command','parser.py',72),
-  ('select_limit_command -> SELECT select_list FROM ID LIMIT NUMBER SEMICOLON','select_limit_command',7,'p_select_limit_command','parser.py',76),
-  ('select_where_limit_command -> SELECT select_list FROM ID WHERE condition LIMIT NUMBER SEMICOLON','select_where_limit_command',9,'p_select_where_limit_command','parser.py',80),
-  ('select_list -> ASTERISK','select_list',1,'p_select_list','parser.py',84),
-  ('select_list -> id_list','select_list',1,'p_select_list','parser.py',85),
-  ('id_list -> ID','id_list',1,'p_id_list','parser.py',89),
-  ('id_list -> id_list COMMA ID','id_list',3,'p_id_list','parser.py',90),
-  ('condition -> ID EQUALS value','condition',3,'p_condition','parser.py',97),
-  ('condition -> ID NOT_EQUALS value','condition',3,'p_condition','parser.py',98),
-  ('condition -> ID LESS_THAN value','condition',3,'p_condition','parser.py',99),
-  ('condition -> ID GREATER_THAN value','condition',3,'p_condition','parser.py',100),
-  ('condition -> ID LESS_EQUALS value','condition',3,'p_condition','parser.py',101),
-  ('condition -> ID GREATER_EQUALS value','condition',3,'p_condition','parser.py',102),
-  ('condition -> condition AND condition','condition',3,'p_condition','parser.py',103),
-  ('value -> ID','value',1,'p_value','parser.py',110),
-  ('value -> STRING','value',1,'p_value','parser.py',111),
-  ('value -> NUMBER','value',1,'p_value','parser.py',112),
-  ('create_command -> create_select_command','create_command',1,'p_create_command','parser.py',117),
-  ('create_command -> create_join_command','create_command',1,'p_create_command','parser.py',118),
-  ('create_select_command -> CREATE TABLE ID SELECT select_list FROM ID WHERE condition SEMICOLON','create_select_command',10,'p_create_select_command','parser.py',122),
-  ('create_select_command -> CREATE TABLE ID SELECT select_list FROM ID SEMICOLON','create_select_command',8,'p_create_select_command','parser.py',123),
-  ('create_join_command -> CREATE TABLE ID FROM ID JOIN ID USING ID SEMICOLON','create_join_command',10,'p_create_join_command','parser.py',130),
-  ('procedure_command -> PROCEDURE ID DO procedure_body END','procedure_command',5,'p_procedure_command','parser.py',135),
-  ('procedure_body -> command','procedure_body',1,'p_procedure_body','parser.py',139),
-  ('procedure_body -> procedure_body command','procedure_body',2,'p_procedure_body','parser.py',140),
-  ('call_command -> CALL ID SEMICOLON','call_command',3,'p_call_command','parser.py',148),
+  ('program -> command','program',1,'p_program','parser.py',19),
+  ('program -> program command','program',2,'p_program','parser.py',20),
+  ('command -> table_command','command',1,'p_command','parser.py',28),
+  ('command -> query_command','command',1,'p_command','parser.py',29),
+  ('command -> create_command','command',1,'p_command','parser.py',30),
+  ('command -> procedure_command','command',1,'p_command','parser.py',31),
+  ('command -> call_command','command',1,'p_command','parser.py',32),
+  ('table_command -> import_command','table_command',1,'p_table_command','parser.py',37),
+  ('table_command -> export_command','table_command',1,'p_table_command','parser.py',38),
+  ('table_command -> discard_command','table_command',1,'p_table_command','parser.py',39),
+  ('table_command -> rename_command','table_command',1,'p_table_command','parser.py',40),
+  ('table_command -> print_command','table_command',1,'p_table_command','parser.py',41),
+  ('table_command -> refresh_command','table_command',1,'p_table_command','parser.py',42),
+  ('import_command -> IMPORT TABLE ID FROM STRING SEMICOLON','import_command',6,'p_import_command','parser.py',46),
+  ('import_command -> IMPORT TABLE ID FROM STRING APPEND SEMICOLON','import_command',7,'p_import_command','parser.py',47),
+  ('export_command -> EXPORT TABLE ID AS STRING SEMICOLON','export_command',6,'p_export_command','parser.py',51),
+  ('export_command -> EXPORT TABLE ID AS STRING COMPRESSION ID SEMICOLON','export_command',8,'p_export_command','parser.py',52),
+  ('export_command -> EXPORT TABLES id_list TO STRING SEMICOLON','export_command',6,'p_export_tables_command','parser.py',59),
+  ('export_command -> EXPORT TABLES id_list TO STRING COMPRESSION ID SEMICOLON','export_command',8,'p_export_tables_command','parser.py',60),
+  ('discard_command -> DISCARD TABLE ID SEMICOLON','discard_command',4,'p_discard_command','parser.py',67),
+  ('rename_command -> RENAME TABLE ID ID SEMICOLON','rename_command',5,'p_rename_command','parser.py',71),
+  ('print_command -> PRINT TABLE ID SEMICOLON','print_command',4,'p_print_command','parser.py',75),
+  ('refresh_command -> REFRESH TABLE ID SEMICOLON','refresh_command',4,'p_refresh_command','parser.py',79),
+  ('query_command -> select_command','query_command',1,'p_query_command','parser.py',84),
+  ('query_command -> select_where_command','query_command',1,'p_query_command','parser.py',85),
+  ('query_command -> select_limit_command','query_command',1,'p_query_command','parser.py',86),
+  ('query_command -> select_where_limit_command','query_command',1,'p_query_command','parser.py',87),
+  ('select_command -> SELECT select_list FROM ID SEMICOLON','select_command',5,'p_select_command','parser.py',91),
+  ('select_where_command -> SELECT select_list FROM ID WHERE condition SEMICOLON','select_where_command',7,'p_select_where_command','parser.py',95),
+  ('select_limit_command -> SELECT select_list FROM ID LIMIT NUMBER SEMICOLON','select_limit_command',7,'p_select_limit_command','parser.py',99),
+  ('select_where_limit_command -> SELECT select_list FROM ID WHERE condition LIMIT NUMBER SEMICOLON','select_where_limit_command',9,'p_select_where_limit_command','parser.py',103),
+  ('select_list -> ASTERISK','select_list',1,'p_select_list','parser.py',107),
+  ('select_list -> select_items','select_list',1,'p_select_list','parser.py',108),
+  ('select_items -> select_item','select_items',1,'p_select_items','parser.py',112),
+  ('select_items -> select_items COMMA select_item','select_items',3,'p_select_items','parser.py',113),
+  ('select_item -> ID','select_item',1,'p_select_item','parser.py',120),
+  ('select_item -> window','select_item',1,'p_select_item','parser.py',121),
+  ('window -> ID LPAREN ID RPAREN OVER LPAREN PARTITION BY ID ORDER BY ID RANGE window_range RPAREN','window',15,'p_window','parser.py',125),
+  ('window -> ID LPAREN ID RPAREN OVER LPAREN ORDER BY ID RANGE window_range RPAREN','window',12,'p_window','parser.py',126),
+  ('window_range -> NUMBER','window_range',1,'p_window_range','parser.py',134),
+  ('window_range -> FLOAT','window_range',1,'p_window_range','parser.py',135),
+  ('window_range -> NUMBER ID','window_range',2,'p_window_range','parser.py',136),
+  ('window_range -> FLOAT ID','window_range',2,'p_window_range','parser.py',137),
+  ('id_list -> ID','id_list',1,'p_id_list','parser.py',142),
+  ('id_list -> id_list COMMA ID','id_list',3,'p_id_list','parser.py',143),
+  ('condition -> ID EQUALS value','condition',3,'p_condition','parser.py',150),
+  ('condition -> ID NOT_EQUALS value','condition',3,'p_condition','parser.py',151),
+  ('condition -> ID LESS_THAN value','condition',3,'p_condition','parser.py',152),
+  ('condition -> ID GREATER_THAN value','condition',3,'p_condition','parser.py',153),
+  ('condition -> ID LESS_EQUALS value','condition',3,'p_condition','parser.py',154),
+  ('condition -> ID GREATER_EQUALS value','condition',3,'p_condition','parser.py',155),
+  ('condition -> condition AND condition','condition',3,'p_condition','parser.py',156),
+  ('condition -> WITHIN LPAREN ID COMMA number COMMA number COMMA number COMMA number RPAREN','condition',12,'p_within_condition','parser.py',163),
+  ('condition -> ID NEAREST NUMBER TO LPAREN number COMMA number RPAREN','condition',9,'p_nearest_condition','parser.py',167),
+  ('value -> ID','value',1,'p_value','parser.py',171),
+  ('value -> STRING','value',1,'p_value','parser.py',172),
+  ('value -> NUMBER','value',1,'p_value','parser.py',173),
+  ('value -> FLOAT','value',1,'p_value','parser.py',174),
+  ('value -> MINUS NUMBER','value',2,'p_value','parser.py',175),
+  ('value -> MINUS FLOAT','value',2,'p_value','parser.py',176),
+  ('number -> NUMBER','number',1,'p_number','parser.py',183),
+  ('number -> FLOAT','number',1,'p_number','parser.py',184),
+  ('number -> MINUS NUMBER','number',2,'p_number','parser.py',185),
+  ('number -> MINUS FLOAT','number',2,'p_number','parser.py',186),
+  ('create_command -> create_select_command','create_command',1,'p_create_command','parser.py',194),
+  ('create_command -> create_join_command','create_command',1,'p_create_command','parser.py',195),
+  ('create_command -> create_materialized_command','create_command',1,'p_create_command','parser.py',196),
+  ('create_select_command -> CREATE TABLE ID SELECT select_list FROM ID WHERE condition SEMICOLON','create_select_command',10,'p_create_select_command','parser.py',200),
+  ('create_select_command -> CREATE TABLE ID SELECT select_list FROM ID SEMICOLON','create_select_command',8,'p_create_select_command','parser.py',201),
+  ('create_join_command -> CREATE TABLE ID FROM ID JOIN ID USING ID SEMICOLON','create_join_command',10,'p_create_join_command','parser.py',208),
+  ('create_join_command -> CREATE TABLE ID FROM ID JOIN ID USING ID WHERE condition SEMICOLON','create_join_command',12,'p_create_join_command','parser.py',209),
+  ('create_materialized_command -> CREATE MATERIALIZED TABLE ID SELECT select_list FROM ID WHERE condition SEMICOLON','create_materialized_command',11,'p_create_materialized_command','parser.py',216),
+  ('create_materialized_command -> CREATE MATERIALIZED TABLE ID SELECT select_list FROM ID SEMICOLON','create_materialized_command',9,'p_create_materialized_command','parser.py',217),
+  ('create_materialized_command -> CREATE MATERIALIZED TABLE ID FROM ID JOIN ID USING ID SEMICOLON','create_materialized_command',11,'p_create_materialized_command','parser.py',218),
+  ('create_materialized_command -> CREATE MATERIALIZED TABLE ID FROM ID JOIN ID USING ID WHERE condition SEMICOLON','create_materialized_command',13,'p_create_materialized_command','parser.py',219),
+  ('procedure_command -> PROCEDURE ID DO procedure_body END','procedure_command',5,'p_procedure_command','parser.py',231),
+  ('procedure_body -> command','procedure_body',1,'p_procedure_body','parser.py',235),
+  ('procedure_body -> procedure_body command','procedure_body',2,'p_procedure_body','parser.py',236),
+  ('call_command -> CALL ID SEMICOLON','call_command',3,'p_call_command','parser.py',244),
 ]
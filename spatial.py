@@ -0,0 +1,182 @@
+import heapq
+import math
+import re
+
+# "[lon,lat]" coordinate pairs as stored in the CSV files
+POINT = re.compile(
+    r"^\s*\[\s*(-?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)\s*,"
+    r"\s*(-?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)\s*\]\s*$"
+)
+
+
+def parse_point(value):
+    """Parse a "[lon,lat]" string into a (lon, lat) pair, or None."""
+    match = POINT.match(value) if isinstance(value, str) else None
+    if match is None:
+        return None
+    return float(match.group(1)), float(match.group(2))
+
+
+def is_point_column(data, col_index):
+    """Check whether every non-empty value of a column is a "[lon,lat]" pair."""
+    found = False
+    for row in data:
+        if col_index >= len(row) or not row[col_index]:
+            continue
+        if parse_point(row[col_index]) is None:
+            return False
+        found = True
+    return found
+
+
+class GridIndex:
+    """Uniform grid over the (lon, lat) points of a table column.
+
+    Points are identified by their row position. Distances are planar, in
+    degrees. The grid is rebuilt with a finer cell size whenever the number
+    of points doubles, so each cell holds about one point on average.
+    """
+
+    def __init__(self, points=()):
+        self.points = []
+        self.cells = {}
+        # (min x, max x, min y, max y) of the occupied cells
+        self.bounds = None
+        self.cell_size = 1.0
+        self.grid_size = 0
+        self.add(points)
+
+    def __len__(self):
+        return len(self.points)
+
+    def cell(self, lon, lat):
+        return (math.floor(lon / self.cell_size), math.floor(lat / self.cell_size))
+
+    def insert(self, row_id, point):
+        x, y = cell = self.cell(*point)
+        self.cells.setdefault(cell, []).append(row_id)
+        if self.bounds is None:
+            self.bounds = (x, x, y, y)
+        else:
+            min_x, max_x, min_y, max_y = self.bounds
+            self.bounds = (min(min_x, x), max(max_x, x), min(min_y, y), max(max_y, y))
+
+    def add(self, points):
+        """Index points for the rows appended after the indexed ones.
+
+        points holds a (lon, lat) pair, or None, per appended row.
+        """
+        start = len(self.points)
+        self.points.extend(points)
+        if len(self.points) > 2 * self.grid_size:
+            self.regrid()
+            return
+        for row_id in range(start, len(self.points)):
+            point = self.points[row_id]
+            if point is not None:
+                self.insert(row_id, point)
+
+    def regrid(self):
+        """Choose a cell size for the current points and rebuild the cells."""
+        located = [point for point in self.points if point is not None]
+        if located:
+            width = max(lon for lon, _ in located) - min(lon for lon, _ in located)
+            height = max(lat for _, lat in located) - min(lat for _, lat in located)
+            side = math.ceil(math.sqrt(len(located)))
+            self.cell_size = max(width, height, 1e-9) / side
+        self.grid_size = max(len(self.points), 1)
+
+        self.cells = {}
+        self.bounds = None
+        for row_id, point in enumerate(self.points):
+            if point is not None:
+                self.insert(row_id, point)
+
+    def within(self, min_lon, min_lat, max_lon, max_lat):
+        """Return the ids of the points inside a box, borders included."""
+        min_x, min_y = self.cell(min_lon, min_lat)
+        max_x, max_y = self.cell(max_lon, max_lat)
+
+        # Visit the cells of the box, or the occupied cells if there are fewer
+        if (max_x - min_x + 1) * (max_y - min_y + 1) <= len(self.cells):
+            cells = (
+                self.cells.get((x, y), ())
+                for x in range(min_x, max_x + 1)
+                for y in range(min_y, max_y + 1)
+            )
+        else:
+            cells = (
+                row_ids
+                for (x, y), row_ids in self.cells.items()
+                if min_x <= x <= max_x and min_y <= y <= max_y
+            )
+
+        found = []
+        for row_ids in cells:
+            for row_id in row_ids:
+                lon, lat = self.points[row_id]
+                if min_lon <= lon <= max_lon and min_lat <= lat <= max_lat:
+                    found.append(row_id)
+        return sorted(found)
+
+    def nearest(self, k, lon, lat):
+        """Return the ids of the k points closest to (lon, lat), in id order.
+
+        Points at the same distance are taken in id order.
+        """
+        if k <= 0 or not self.cells:
+            return []
+
+        min_x, max_x, min_y, max_y = self.bounds
+        center_x, center_y = self.cell(lon, lat)
+        # Rings closer than this radius contain no occupied cell
+        min_radius = max(
+            0, min_x - center_x, center_x - max_x, min_y - center_y, center_y - max_y
+        )
+        # Rings beyond this radius contain no occupied cell
+        max_radius = max(
+            abs(center_x - min_x),
+            abs(center_x - max_x),
+            abs(center_y - min_y),
+            abs(center_y - max_y),
+        )
+
+        # Max-heap of the best (distance, id) pairs found so far
+        best = []
+        for radius in range(min_radius, max_radius + 1):
+            # Every point outside the rings visited is at least this far
+            if len(best) == k and -best[0][0] < (radius - 1) * self.cell_size:
+                break
+            if 8 * radius > len(self.cells):
+                # The rings left are larger than the occupied cells: scan those
+                for (x, y), row_ids in self.cells.items():
+                    if max(abs(x - center_x), abs(y - center_y)) >= radius:
+                        self.closest(best, k, row_ids, lon, lat)
+                break
+            for cell in self.ring(center_x, center_y, radius):
+                self.closest(best, k, self.cells.get(cell, ()), lon, lat)
+
+        return sorted(-row_id for _, row_id in best)
+
+    def closest(self, best, k, row_ids, lon, lat):
+        """Keep in the heap best the k points closest to (lon, lat)."""
+        for row_id in row_ids:
+            point_lon, point_lat = self.points[row_id]
+            candidate = (-math.hypot(point_lon - lon, point_lat - lat), -row_id)
+            if len(best) < k:
+                heapq.heappush(best, candidate)
+            elif candidate > best[0]:
+                heapq.heapreplace(best, candidate)
+
+    def ring(self, center_x, center_y, radius):
+        """Return the cells at a given Chebyshev distance from a cell."""
+        if radius == 0:
+            return [(center_x, center_y)]
+        cells = []
+        for x in range(center_x - radius, center_x + radius + 1):
+            cells.append((x, center_y - radius))
+            cells.append((x, center_y + radius))
+        for y in range(center_y - radius + 1, center_y + radius):
+            cells.append((center_x - radius, y))
+            cells.append((center_x + radius, y))
+        return cells
@@ -0,0 +1,192 @@
+import bz2
+import csv
+import gzip
+import io
+import lzma
+import os
+import threading
+
+# Supported compressions: name -> (open function, file extension, magic bytes)
+COMPRESSIONS = {
+    "gzip": (gzip.open, ".gz", b"\x1f\x8b"),
+    "bz2": (bz2.open, ".bz2", b"BZh"),
+    "xz": (lzma.open, ".xz", b"\xfd7zXZ\x00"),
+}
+
+# Size of the buffer between the CSV encoder and the file
+WRITE_BUFFER = 1 << 20
+# Number of rows encoded before each write to the file
+WRITE_CHUNK = 10000
+# Number of leading bytes compared to detect a file rewritten in place
+FINGERPRINT_SIZE = 1024
+
+
+def compression_for(filename, option=None):
+    """Return the compression to use for a file, from an option or its extension.
+
+    Raises ValueError for an unknown compression option.
+    """
+    if option is not None:
+        option = option.lower()
+        if option == "none":
+            return None
+        if option not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression '{option}'.")
+        return option
+
+    for name, (_, extension, _) in COMPRESSIONS.items():
+        if filename.endswith(extension):
+            return name
+    return None
+
+
+def detect_compression(filename):
+    """Return the compression of an existing file from its magic bytes."""
+    with open(filename, "rb") as file:
+        start = file.read(8)
+    for name, (_, _, magic) in COMPRESSIONS.items():
+        if start.startswith(magic):
+            return name
+    return None
+
+
+def open_text(filename):
+    """Open a possibly compressed file for reading as text."""
+    compression = detect_compression(filename)
+    if compression is None:
+        return open(filename, "r", newline="")
+    return COMPRESSIONS[compression][0](filename, "rt", newline="")
+
+
+def write_csv_atomic(filename, header, rows, compression=None):
+    """Write a CSV file through a temporary file renamed into place.
+
+    Readers never see a partially written file: either the previous file or
+    the complete new one is present at filename.
+    """
+    tmp_path = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "xb", buffering=WRITE_BUFFER) as raw:
+            stream = COMPRESSIONS[compression][0](raw, "wb") if compression else raw
+            text = io.TextIOWrapper(stream, newline="")
+
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(header)
+            for start in range(0, len(rows), WRITE_CHUNK):
+                writer.writerows(rows[start : start + WRITE_CHUNK])
+                text.write(buffer.getvalue())
+                buffer.seek(0)
+                buffer.truncate()
+            text.write(buffer.getvalue())
+
+            text.flush()
+            text.detach()
+            if compression:
+                # Writes the compressed stream trailer, raw stays open
+                stream.close()
+            raw.flush()
+            os.fsync(raw.fileno())
+        os.replace(tmp_path, filename)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def read_rows(csvfile):
+    """Yield the rows of a CSV stream, skipping blank lines and comment lines."""
+    for row in csv.reader(csvfile):
+        if row and not row[0].startswith("#"):
+            yield row
+
+
+def holds_row(line, encoding):
+    """Check whether the bytes of a line hold a row read_rows() would keep."""
+    return any(read_rows(io.StringIO(line.decode(encoding, "replace"), newline="")))
+
+
+def file_source(csvfile, filename):
+    """Describe a file read up to its end by open_text(), to later read only
+    the bytes appended to it with read_appended().
+
+    Returns the source and the bytes of the last line when it has no newline
+    yet. Like read_appended(), the source ends before that line, which may
+    still be being written, so it is read again once it is complete; a file
+    with a single line ends after it.
+    """
+    stat = os.fstat(csvfile.fileno())
+    source = {
+        "filename": filename,
+        "device": stat.st_dev,
+        "inode": stat.st_ino,
+        "offset": None,
+        "fingerprint": None,
+    }
+    fragment = b""
+    # Compressed files can only be reloaded entirely
+    if isinstance(csvfile.buffer, io.BufferedReader):
+        raw = csvfile.buffer
+        end = raw.tell()
+        source["offset"] = end
+        # Look backwards for the newline ending the last complete line
+        position = end
+        while position > 0:
+            start = max(0, position - FINGERPRINT_SIZE)
+            raw.seek(start)
+            newline = raw.read(position - start).rfind(b"\n")
+            if newline >= 0:
+                source["offset"] = start + newline + 1
+                break
+            position = start
+        raw.seek(source["offset"])
+        fragment = raw.read(end - source["offset"])
+
+        raw.seek(0)
+        source["fingerprint"] = raw.read(min(FINGERPRINT_SIZE, source["offset"]))
+    return source, fragment
+
+
+def same_file(file, source):
+    """Check whether an open binary file still starts with the data source
+    was recorded from: it was neither replaced nor truncated nor rewritten.
+
+    Compressed files are only checked for replacement.
+    """
+    stat = os.fstat(file.fileno())
+    if (stat.st_dev, stat.st_ino) != (source["device"], source["inode"]):
+        return False
+    if source["offset"] is None:
+        return True
+    if stat.st_size < source["offset"]:
+        return False
+    return file.read(len(source["fingerprint"])) == source["fingerprint"]
+
+
+def read_appended(source):
+    """Return a text stream with the lines appended to a file since source
+    was recorded, and the updated source.
+
+    The updated source ends before a last line without its newline, which
+    may still be being written, and its "partial" entry tells whether that
+    line holds a row. Returns None when the file has to be read again from
+    the start: it is compressed, was truncated, or was replaced by another
+    file.
+    """
+    if source["offset"] is None:
+        return None
+
+    with open(source["filename"], "rb") as file:
+        if not same_file(file, source):
+            return None
+        file.seek(source["offset"])
+        chunk = file.read()
+
+    end = chunk.rfind(b"\n") + 1
+    text = io.TextIOWrapper(io.BytesIO(chunk), newline="")
+    updated = dict(
+        source,
+        offset=source["offset"] + end,
+        partial=holds_row(chunk[end:], text.encoding),
+    )
+    return text, updated
@@ -0,0 +1,39 @@
+import sys
+import os
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from parser import Parser
+from cache import ParseCache
+
+parser = Parser()
+cache = ParseCache(parser, verbose=True)
+
+script = os.path.join(tempfile.mkdtemp(), "script.cql")
+examples = [
+    'IMPORT TABLE estacoes FROM "estacoes.csv";\nSELECT * FROM estacoes;',
+    'IMPORT TABLE estacoes FROM "estacoes.csv";\nSELECT * FROM estacoes;',
+    'IMPORT TABLE estacoes FROM "estacoes.csv";\nSELECT Id FROM estacoes;',
+]
+
+for example in examples:
+    print("Input:", example)
+    with open(script, "w") as file:
+        file.write(example)
+    result = cache.load(script, example)
+    print("AST:", result)
+    print("Matches parser:", result == parser.parse(example))
+    print("-" * 40)
+
+# A change to the action of a rule alone gives another grammar version
+directory = tempfile.mkdtemp()
+with open(os.path.join(os.path.dirname(__file__), "..", "parser.py")) as file:
+    source = file.read()
+with open(os.path.join(directory, "changed_parser.py"), "w") as file:
+    file.write(source.replace('("CALL", p[2])', '("CALL", p[2].lower())'))
+sys.path.insert(0, directory)
+from changed_parser import Parser as ChangedParser
+
+changed = ChangedParser()
+print("Action changed:", changed.parse("CALL Quentes;") != parser.parse("CALL Quentes;"))
+print("Version changed:", changed.grammar_version() != parser.grammar_version())
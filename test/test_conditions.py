@@ -0,0 +1,53 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from interpreter import Interpreter
+from conditions import split_join_condition
+
+interpreter = Interpreter()
+data_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
+interpreter.interpret(
+    f'IMPORT TABLE estacoes FROM "{data_dir}/estacoes.csv";'
+    f'IMPORT TABLE observacoes FROM "{data_dir}/observacoes.csv";'
+)
+
+conditions = [
+    "Temperatura > 16",
+    "Local = Graciosa AND Temperatura > 10",
+    "Id <> E2 AND Humidade >= 90 AND Local > O",
+    "Id = E3",
+    "Temperatura > 16 AND Altitude > 100",
+    "Temperatura > 16 AND Coordenadas NEAREST 2 TO (-28.0, 39.0)",
+    "Coordenadas NEAREST 3 TO (-8.5, 40.0) AND Temperatura > 16 AND Id <> E4",
+]
+
+for i, condition in enumerate(conditions):
+    print("Condition:", condition)
+    ast = interpreter.parser.parse(
+        f"SELECT * FROM estacoes_obs WHERE {condition};"
+    )[0][3]
+    print(
+        "Plan:",
+        split_join_condition(
+            interpreter.tables["estacoes"]["header"],
+            interpreter.tables["observacoes"]["header"],
+            "Id",
+            ast,
+        ),
+    )
+
+    # Filtering while joining gives the same rows as joining then filtering
+    output = interpreter.interpret(
+        f"CREATE TABLE pushed_{i} FROM estacoes JOIN observacoes USING Id "
+        f"WHERE {condition};"
+        f"CREATE TABLE joined_{i} FROM estacoes JOIN observacoes USING Id;"
+        f"CREATE TABLE filtered_{i} SELECT * FROM joined_{i} WHERE {condition};"
+    )
+    print(output)
+    same = (
+        interpreter.tables[f"pushed_{i}"]["data"]
+        == interpreter.tables[f"filtered_{i}"]["data"]
+    )
+    print("Matches join then filter:", same)
+    print("-" * 40)
@@ -0,0 +1,87 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from interpreter import Interpreter
+from cursor import QueryError
+
+interpreter = Interpreter()
+data_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
+interpreter.interpret(
+    f'IMPORT TABLE estacoes FROM "{data_dir}/estacoes.csv";'
+    f'IMPORT TABLE observacoes FROM "{data_dir}/observacoes.csv";'
+)
+
+cursor = interpreter.query(
+    "SELECT Id, Temperatura, Humidade FROM observacoes WHERE Temperatura > 15;"
+)
+print("Description:", cursor.description)
+print("fetchone:", cursor.fetchone())
+print("fetchmany(2):", cursor.fetchmany(2))
+print("Remaining:", list(cursor))
+print("After the last row:", cursor.fetchone(), cursor.fetchmany(3))
+print("-" * 40)
+
+examples = [
+    "SELECT * FROM estacoes;",
+    "SELECT * FROM observacoes WHERE Radiacao > 100;",
+    "SELECT Id, DataHoraObservacao FROM observacoes LIMIT 2;",
+    "SELECT Local FROM estacoes WHERE WITHIN(Coordenadas, -9.5, 36.9, -6.1, 42.2);",
+]
+
+for example in examples:
+    print("Input:", example)
+    cursor = interpreter.query(example)
+    print([(column.name, column.type.__name__) for column in cursor.description])
+    rows = [row for row in cursor]
+    for row in rows:
+        print(row)
+
+    # The text output holds the same rows, as read from the CSV file
+    types = [column.type for column in cursor.description]
+    text = [
+        tuple(
+            None if column_type is not str and value == "" else column_type(value)
+            for value, column_type in zip(line.split(" | "), types)
+        )
+        for line in interpreter.interpret(example)[0].split("\n")[2:]
+    ]
+    print("Rows match text output:", text == rows)
+    print("-" * 40)
+
+for example in [
+    "SELECT Altitude FROM estacoes;",
+    "SELECT * FROM desconhecida;",
+    "PRINT TABLE estacoes;",
+]:
+    print("Input:", example)
+    try:
+        interpreter.query(example)
+    except QueryError as e:
+        print("QueryError:", e)
+    print("-" * 40)
+
+# Rows shorter or longer than the header are returned whole by *
+interpreter.tables["irregular"] = {
+    "header": ["Id", "Temperatura", "Humidade"],
+    "data": [["E1", "23.2", "58"], ["E2", "12.5"], ["E3", "16.4", "96", "extra"]],
+}
+example = "SELECT * FROM irregular;"
+print("Input:", example)
+print(interpreter.interpret(example))
+cursor = interpreter.query(example)
+print([(column.name, column.type.__name__) for column in cursor.description])
+print(cursor.fetchall())
+print("-" * 40)
+
+for example in [
+    "SELECT Id FROM observacoes WHERE Pressao > 10;",
+    "SELECT * FROM estacoes WHERE Id = E1 AND Altitude > 3;",
+]:
+    print("Input:", example)
+    print(interpreter.interpret(example))
+    try:
+        interpreter.query(example)
+    except QueryError as e:
+        print("QueryError:", e)
+    print("-" * 40)
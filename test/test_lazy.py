@@ -0,0 +1,90 @@
+import sys
+import os
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from interpreter import Interpreter
+
+data_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
+lazy = Interpreter()
+eager = Interpreter()
+for name in ("estacoes", "observacoes"):
+    eager.tables[name] = eager.read_csv(f"{data_dir}/{name}.csv")
+eager.interpret(
+    "PROCEDURE quentes DO"
+    "  CREATE TABLE quentes SELECT Id FROM observacoes WHERE Temperatura > 20;"
+    "END"
+)
+
+
+def loaded(table):
+    """Describe which columns of a table hold values."""
+    if "lazy" not in table:
+        return "all columns"
+    if table["lazy"]["columns"] is None:
+        return "none, not used yet"
+    return ", ".join(col for col in table["header"] if col in table["lazy"]["columns"])
+
+
+print(
+    lazy.interpret(
+        f'IMPORT TABLE observacoes FROM "{data_dir}/observacoes.csv";'
+        f'IMPORT TABLE estacoes FROM "{data_dir}/estacoes.csv";'
+        "PROCEDURE quentes DO"
+        "  CREATE TABLE quentes SELECT Id FROM observacoes WHERE Temperatura > 20;"
+        "END"
+    )
+)
+print("Rows before first use:", len(lazy.tables["observacoes"]["data"]))
+
+examples = [
+    "SELECT Id, Humidade FROM observacoes WHERE Radiacao > 100;",
+    "CALL quentes;",
+    "SELECT Id, DataHoraObservacao FROM observacoes LIMIT 2;",
+    "SELECT Local FROM estacoes WHERE WITHIN(Coordenadas, -9.5, 36.9, -6.1, 42.2);",
+    "PRINT TABLE observacoes;",
+    "CREATE TABLE obs_estacoes FROM observacoes JOIN estacoes USING Id;",
+    "PRINT TABLE obs_estacoes;",
+]
+
+for example in examples:
+    print("Input:", example)
+    expected = eager.interpret(example)
+    output = lazy.interpret(example)
+    print(output)
+    print("Lazy matches eager:", output == expected)
+    print("observacoes columns read:", loaded(lazy.tables["observacoes"]))
+    print("estacoes columns read:", loaded(lazy.tables["estacoes"]))
+    print("-" * 40)
+
+# Columns read later are matched to the rows appended by REFRESH, with a
+# blank line and a line still being written in the appended chunk
+filename = os.path.join(tempfile.mkdtemp(), "observacoes.csv")
+shutil.copy(f"{data_dir}/observacoes.csv", filename)
+refreshed = Interpreter()
+print(refreshed.interpret(f'IMPORT TABLE obs FROM "{filename}"; SELECT Id FROM obs;'))
+with open(filename, "a") as file:
+    file.write(
+        "\nE5,1.0,5.5,0.0,N,1.0,50.0,2025-04-10T20:00\n"
+        "E6,1.0,6.6,0.0,N,1.0,50.0,2025-04-10T20:00\nE7,1.0,7.7,0.0,N,1.0,50.0"
+    )
+print(refreshed.interpret("REFRESH TABLE obs;"))
+
+for example in ["SELECT Id, Temperatura FROM obs;", "SELECT * FROM obs;"]:
+    print("Input:", example)
+    output = refreshed.interpret(example)
+    print(output)
+    checked = Interpreter()
+    checked.tables["obs"] = checked.read_csv(filename)
+    print("Matches a full read:", output == checked.interpret(example))
+    print("-" * 40)
+
+# Rows that did not come from the file make the table be read again
+refreshed = Interpreter()
+print(refreshed.interpret(f'IMPORT TABLE obs FROM "{filename}"; SELECT Id FROM obs;'))
+refreshed.append_rows("obs", [["E9", "", "9.9", "", "", "", "", ""]])
+output = refreshed.interpret("SELECT Id, Temperatura FROM obs;")
+print(output)
+expected = checked.interpret("SELECT Id, Temperatura FROM obs;")
+print("Matches a full read:", output == expected)
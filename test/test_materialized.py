@@ -0,0 +1,106 @@
+import sys
+import os
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from interpreter import Interpreter
+
+interpreter = Interpreter()
+data_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
+tmp_dir = tempfile.mkdtemp()
+for name in ("estacoes.csv", "observacoes.csv"):
+    shutil.copy(os.path.join(data_dir, name), tmp_dir)
+
+
+def append(name, text):
+    with open(os.path.join(tmp_dir, name), "a") as file:
+        file.write(text)
+
+
+steps = [
+    (None, f'IMPORT TABLE estacoes FROM "{tmp_dir}/estacoes.csv";'),
+    (None, f'IMPORT TABLE observacoes FROM "{tmp_dir}/observacoes.csv";'),
+    (
+        None,
+        "CREATE MATERIALIZED TABLE ventos_fortes SELECT Id, IntensidadeVentoKM "
+        "FROM observacoes WHERE IntensidadeVentoKM > 10;",
+    ),
+    (
+        None,
+        "CREATE MATERIALIZED TABLE estacoes_obs FROM estacoes JOIN observacoes USING Id;",
+    ),
+    (
+        lambda: append(
+            "observacoes.csv",
+            "E1,3.1,22.0,120.5,N,0.9,60.0,2025-04-10T20:00\n"
+            "E2,14.0,12.1,600.0,E,3.9,98.0,2025-04-10T20:00\n",
+        ),
+        "REFRESH TABLE observacoes;",
+    ),
+    (
+        lambda: append("estacoes.csv", 'E5,Braga,"[-8.4,41.5]"\n'),
+        "REFRESH TABLE estacoes;",
+    ),
+    (
+        lambda: append(
+            "observacoes.csv", "E5,12.0,18.0,0.0,S,3.3,70.0,2025-04-10T20:00\n"
+        ),
+        "REFRESH TABLE observacoes;",
+    ),
+    (None, "PRINT TABLE ventos_fortes;"),
+    (None, "PRINT TABLE estacoes_obs;"),
+    (None, "RENAME TABLE observacoes obs;"),
+    (None, "REFRESH TABLE estacoes_obs;"),
+    # Tables whose base is replaced by one without their columns, or
+    # discarded, keep their rows but are no longer refreshed
+    (None, f'IMPORT TABLE leituras FROM "{tmp_dir}/observacoes.csv";'),
+    (
+        None,
+        "CREATE MATERIALIZED TABLE temperaturas SELECT Id, Temperatura "
+        "FROM leituras WHERE Temperatura > 16;",
+    ),
+    (None, f'IMPORT TABLE postos FROM "{tmp_dir}/estacoes.csv";'),
+    (None, "CREATE MATERIALIZED TABLE locais SELECT Id, Local FROM postos;"),
+    (None, f'IMPORT TABLE leituras FROM "{tmp_dir}/estacoes.csv";'),
+    (
+        lambda: append("estacoes.csv", 'E6,Porto,"[-8.6,41.1]"\n'),
+        "REFRESH TABLE leituras;",
+    ),
+    (None, "REFRESH TABLE temperaturas;"),
+    (None, "PRINT TABLE temperaturas;"),
+    (None, "DISCARD TABLE postos;"),
+    (None, f'IMPORT TABLE postos FROM "{tmp_dir}/observacoes.csv";'),
+    (
+        lambda: append(
+            "observacoes.csv", "E6,8.0,15.0,0.0,N,2.2,80.0,2025-04-10T21:00\n"
+        ),
+        "REFRESH TABLE postos;",
+    ),
+    (None, "REFRESH TABLE locais;"),
+    (None, "PRINT TABLE locais;"),
+]
+
+for change, example in steps:
+    if change:
+        change()
+    print("Input:", example)
+    output = interpreter.interpret(example)
+    if output:
+        print(output)
+    print("-" * 40)
+
+# Incrementally maintained tables hold the same rows as a full rebuild
+for name, query in [
+    (
+        "ventos_fortes",
+        "CREATE TABLE check_ventos SELECT Id, IntensidadeVentoKM "
+        "FROM obs WHERE IntensidadeVentoKM > 10;",
+    ),
+    ("estacoes_obs", "CREATE TABLE check_join FROM estacoes JOIN obs USING Id;"),
+]:
+    interpreter.interpret(query)
+    check_name = query.split()[2]
+    incremental = sorted(interpreter.tables[name]["data"])
+    rebuilt = sorted(interpreter.tables[check_name]["data"])
+    print(name, "matches full rebuild:", incremental == rebuilt)
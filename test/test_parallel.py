@@ -0,0 +1,59 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from interpreter import Interpreter
+
+sequential = Interpreter(parallelism=1)
+parallel = Interpreter(parallelism=4, parallel_threshold=100)
+
+estacoes = {
+    "header": ["Id", "Local"],
+    "data": [[f"E{i}", f"Local {i}"] for i in range(50)],
+}
+observacoes = {
+    "header": ["Id", "Temperatura"],
+    "data": [[f"E{i % 60}", str(10 + i % 17)] for i in range(5000)],
+}
+
+for interpreter in (sequential, parallel):
+    interpreter.tables["estacoes"] = estacoes
+    interpreter.tables["observacoes"] = observacoes
+
+examples = [
+    "SELECT * FROM observacoes WHERE Temperatura > 22;",
+    "SELECT Id FROM observacoes WHERE Temperatura >= 15 AND Id = E7 LIMIT 5;",
+    "CREATE TABLE obs_estacoes FROM observacoes JOIN estacoes USING Id;",
+    "PRINT TABLE obs_estacoes;",
+]
+
+for example in examples:
+    print("Input:", example)
+    expected = sequential.interpret(example)
+    output = parallel.interpret(example)
+    print("Parallel matches sequential:", output == expected)
+    print("-" * 40)
+
+parallel.executor.shutdown()
+
+# The rows are copied to shared memory once and again after an append
+parallel = Interpreter(parallelism=4, parallel_threshold=100, backend="python")
+parallel.tables["observacoes"] = {
+    "header": observacoes["header"],
+    "data": [list(row) for row in observacoes["data"]],
+}
+example = "SELECT Id FROM observacoes WHERE Temperatura > 22;"
+parallel.interpret(example)
+shared = parallel.tables["observacoes"]["shared"]
+parallel.interpret("SELECT * FROM observacoes WHERE Id = E3;")
+print("Shared copy reused:", parallel.tables["observacoes"]["shared"] is shared)
+
+parallel.append_rows("observacoes", [["E3", "30"]])
+print("Shared copy dropped on append:", "shared" not in parallel.tables["observacoes"])
+observacoes["data"].append(["E3", "30"])
+output = parallel.interpret(example)
+print("Parallel matches sequential:", output == sequential.interpret(example))
+shared = parallel.tables["observacoes"]["shared"]
+print("Shared copy holds the appended row:", shared.count == 5001)
+
+parallel.executor.shutdown()
@@ -0,0 +1,72 @@
+import sys
+import os
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from interpreter import Interpreter
+
+interpreter = Interpreter()
+data_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
+filename = os.path.join(tempfile.mkdtemp(), "observacoes.csv")
+shutil.copy(os.path.join(data_dir, "observacoes.csv"), filename)
+
+
+def append(text):
+    with open(filename, "a") as file:
+        file.write(text)
+
+
+def rewrite(text):
+    with open(filename, "w") as file:
+        file.write(text)
+
+
+steps = [
+    (None, f'IMPORT TABLE observacoes FROM "{filename}";'),
+    (None, "SELECT Id FROM observacoes LIMIT 2;"),
+    (
+        lambda: append("E1,3.1,22.0,120.5,N,0.9,60.0,2025-04-10T20:00\n"),
+        "REFRESH TABLE observacoes;",
+    ),
+    (
+        lambda: append("E2,14.0,12.1,600.0,E,3.9,98.0,2025-04-10T20:00\nE3,4.2"),
+        f'IMPORT TABLE observacoes FROM "{filename}" APPEND;',
+    ),
+    (
+        lambda: append(",16.0,0.0,NE,1.2,95.0,2025-04-10T20:00\n"),
+        "REFRESH TABLE observacoes;",
+    ),
+    (None, "REFRESH TABLE observacoes;"),
+    (lambda: rewrite("Id,Temperatura\nE9,10.0\n"), "REFRESH TABLE observacoes;"),
+    (None, "PRINT TABLE observacoes;"),
+    # A last line without its newline is read again once it is complete
+    (lambda: rewrite("Id,Temperatura\nE9,10.0\nE7,1"), "REFRESH TABLE observacoes;"),
+    (lambda: append("0.5\n\nE8,2.0\n"), "REFRESH TABLE observacoes;"),
+    (None, "PRINT TABLE observacoes;"),
+    (lambda: append("E6,3"), f'IMPORT TABLE observacoes FROM "{filename}";'),
+    (None, "PRINT TABLE observacoes;"),
+    (lambda: append(".5\n"), "REFRESH TABLE observacoes;"),
+    (None, "PRINT TABLE observacoes;"),
+    (None, f'IMPORT TABLE observacoes FROM "{data_dir}/observacoes.csv" APPEND;'),
+    # Materialized tables follow a row read again with other values
+    (
+        None,
+        "CREATE MATERIALIZED TABLE frescas SELECT Id, Temperatura FROM observacoes "
+        "WHERE Temperatura = 1;",
+    ),
+    (lambda: append("E5,1"), "REFRESH TABLE observacoes;"),
+    (None, "PRINT TABLE frescas;"),
+    (lambda: append("2.0\n"), "REFRESH TABLE observacoes;"),
+    (None, "PRINT TABLE frescas;"),
+]
+
+for change, example in steps:
+    if change:
+        change()
+    print("Input:", example)
+    output = interpreter.interpret(example)
+    if output:
+        print(output)
+    print("Rows:", len(interpreter.tables["observacoes"]["data"]))
+    print("-" * 40)
@@ -0,0 +1,89 @@
+import sys
+import os
+import math
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from interpreter import Interpreter
+from spatial import GridIndex
+
+interpreter = Interpreter()
+data_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
+
+examples = [
+    f'IMPORT TABLE estacoes FROM "{data_dir}/estacoes.csv";',
+    f'IMPORT TABLE observacoes FROM "{data_dir}/observacoes.csv";',
+    "SELECT Id, Local FROM estacoes WHERE WITHIN(Coordenadas, -9, 38, -7.5, 42);",
+    "SELECT Id, Local FROM estacoes WHERE Coordenadas NEAREST 2 TO (-8.4, 41.5);",
+    "SELECT Id FROM estacoes WHERE Id <> E1 AND Coordenadas NEAREST 1 TO (-8.4, 41.5);",
+    "CREATE TABLE perto FROM estacoes JOIN observacoes USING Id "
+    "WHERE Coordenadas NEAREST 2 TO (-8.0, 37.5) AND Temperatura > 16;",
+    "PRINT TABLE perto;",
+    "CREATE TABLE continente FROM observacoes JOIN estacoes USING Id "
+    "WHERE WITHIN(Coordenadas, -10, 36, -6, 42.5);",
+    "SELECT Id, Local FROM continente;",
+]
+
+for example in examples:
+    print("Input:", example)
+    output = interpreter.interpret(example)
+    if output:
+        print(output)
+    print("-" * 40)
+
+# The grid gives the same answers as a full scan
+random.seed(0)
+points = [
+    (random.uniform(-31, -6), random.uniform(32, 43)) if random.random() > 0.05 else None
+    for _ in range(5000)
+]
+index = GridIndex(points[:4000])
+index.add(points[4000:])
+located = [(i, point) for i, point in enumerate(points) if point is not None]
+
+same = True
+for _ in range(100):
+    lon, lat = random.uniform(-35, 0), random.uniform(30, 45)
+    k = random.randint(1, 10)
+    by_distance = sorted(
+        (math.hypot(point[0] - lon, point[1] - lat), i) for i, point in located
+    )
+    same &= index.nearest(k, lon, lat) == sorted(i for _, i in by_distance[:k])
+
+    min_lon, max_lon = sorted(random.uniform(-32, -5) for _ in range(2))
+    min_lat, max_lat = sorted(random.uniform(31, 44) for _ in range(2))
+    inside = [
+        i
+        for i, (point_lon, point_lat) in located
+        if min_lon <= point_lon <= max_lon and min_lat <= point_lat <= max_lat
+    ]
+    same &= index.within(min_lon, min_lat, max_lon, max_lat) == inside
+print("Grid matches full scan:", same)
+
+# Large tables answer WITHIN from the index instead of a parallel full scan
+parallel = Interpreter(parallelism=4, parallel_threshold=1000, backend="python")
+sequential = Interpreter(parallelism=1, backend="python")
+for other in (parallel, sequential):
+    other.tables["pontos"] = {
+        "header": ["Id", "Coordenadas"],
+        "data": [
+            [f"P{i % 7}", f"[{point[0]},{point[1]}]" if point else ""]
+            for i, point in enumerate(points)
+        ],
+    }
+scans = []
+scan = parallel.executor.filter_indices
+parallel.executor.filter_indices = lambda *args: scans.append(args) or scan(*args)
+
+for example in [
+    "SELECT Id, Coordenadas FROM pontos WHERE WITHIN(Coordenadas, -20, 35, -10, 40);",
+    "SELECT Coordenadas FROM pontos WHERE Id = P3 AND WITHIN(Coordenadas, -20, 35, "
+    "-10, 40) AND Id <> P4;",
+    "SELECT Id FROM pontos WHERE Id <> P1;",
+]:
+    print("Input:", example)
+    output = parallel.interpret(example)
+    print("Parallel matches sequential:", output == sequential.interpret(example))
+    print("Partitions scanned:", len(scans))
+    print("-" * 40)
+parallel.executor.shutdown()
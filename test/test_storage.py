@@ -0,0 +1,48 @@
+import sys
+import os
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from interpreter import Interpreter
+from storage import detect_compression
+
+interpreter = Interpreter()
+data_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
+out_dir = tempfile.mkdtemp()
+
+examples = [
+    f'IMPORT TABLE estacoes FROM "{data_dir}/estacoes.csv";',
+    f'IMPORT TABLE observacoes FROM "{data_dir}/observacoes.csv";',
+    f'EXPORT TABLE estacoes AS "{out_dir}/estacoes.csv.gz";',
+    f'EXPORT TABLE observacoes AS "{out_dir}/observacoes.dat" COMPRESSION xz;',
+    f'EXPORT TABLES estacoes, observacoes TO "{out_dir}/all" COMPRESSION bz2;',
+    f'IMPORT TABLE estacoes_gz FROM "{out_dir}/estacoes.csv.gz";',
+    f'IMPORT TABLE observacoes_xz FROM "{out_dir}/observacoes.dat";',
+    f'IMPORT TABLE observacoes_bz2 FROM "{out_dir}/all/observacoes.csv.bz2";',
+    "PRINT TABLE estacoes_gz;",
+    f'EXPORT TABLE estacoes AS "{out_dir}/estacoes.csv" COMPRESSION zip;',
+]
+
+for example in examples:
+    print("Input:", example)
+    output = interpreter.interpret(example)
+    if output:
+        print(output)
+    print("-" * 40)
+
+names = sorted(os.listdir(out_dir)) + sorted(
+    "all/" + name for name in os.listdir(os.path.join(out_dir, "all"))
+)
+for name in names:
+    path = os.path.join(out_dir, name)
+    if os.path.isfile(path):
+        print(name, detect_compression(path))
+
+for copy, original in [
+    ("estacoes_gz", "estacoes"),
+    ("observacoes_xz", "observacoes"),
+    ("observacoes_bz2", "observacoes"),
+]:
+    interpreter.load_table(copy)
+    same = interpreter.tables[copy]["data"] == interpreter.tables[original]["data"]
+    print(copy, "matches", original, ":", same)
@@ -0,0 +1,97 @@
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from interpreter import Interpreter
+from vectorized import available
+
+if not available():
+    print("NumPy is not installed, skipping the vectorized backend tests.")
+else:
+    python_backend = Interpreter(backend="python")
+    numpy_backend = Interpreter(backend="numpy")
+    numpy_backend.vectorized.min_rows = 0
+
+    data_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
+    random.seed(0)
+    generated = {
+        "header": ["Id", "Temperatura", "Radiacao", "IntensidadeVentoKM", "Nota"],
+        "data": [
+            [
+                f"E{random.randint(1, 20)}",
+                f"{random.uniform(-5, 40):.1f}",
+                str(random.choice([0, 0.0, 12, 133.2, 679.6, 1000])),
+                f"{random.uniform(0, 30):.1f}",
+                random.choice(["", "ok", "Olhão", "a b", "9"]),
+            ]
+            for _ in range(3000)
+        ],
+    }
+    for interpreter in (python_backend, numpy_backend):
+        interpreter.interpret(
+            f'IMPORT TABLE estacoes FROM "{data_dir}/estacoes.csv";'
+            f'IMPORT TABLE observacoes FROM "{data_dir}/observacoes.csv";'
+        )
+        interpreter.tables["generated"] = generated
+
+    examples = [
+        "SELECT * FROM observacoes;",
+        "SELECT * FROM observacoes WHERE Temperatura > 16;",
+        "SELECT Id, Temperatura FROM observacoes WHERE Temperatura <= 16.4;",
+        "SELECT * FROM estacoes LIMIT 2;",
+        "SELECT Local, Id FROM estacoes WHERE Local >= Olh LIMIT 1;",
+        "SELECT * FROM estacoes WHERE Coordenadas <> x AND Id < E3;",
+        "SELECT * FROM observacoes WHERE Altitude > 3;",
+        "SELECT * FROM estacoes WHERE WITHIN(Coordenadas, -9, 37, -7, 42) AND Id <> E1;",
+        "SELECT * FROM generated WHERE Temperatura > 16 AND Radiacao = 0;",
+        "SELECT Id, Nota FROM generated WHERE Nota = \"\" LIMIT 20;",
+        "SELECT Nota, Temperatura FROM generated WHERE IntensidadeVentoKM >= 10;",
+        "SELECT * FROM generated WHERE Id = E7 AND Temperatura < 5 LIMIT 3;",
+        "SELECT Id FROM generated WHERE Nota < a;",
+        "CREATE TABLE quentes SELECT Id, Temperatura FROM generated "
+        "WHERE Temperatura > 30;",
+        "PRINT TABLE quentes;",
+        "CREATE TABLE todas SELECT * FROM generated;",
+        "PRINT TABLE todas;",
+        "CREATE TABLE juntas FROM estacoes JOIN observacoes USING Id "
+        "WHERE Temperatura > 16;",
+        "PRINT TABLE juntas;",
+    ]
+
+    for example in examples:
+        print("Input:", example)
+        expected = python_backend.interpret(example)
+        output = numpy_backend.interpret(example)
+        print("NumPy matches Python:", output == expected)
+        print("-" * 40)
+
+    # Arrays are only built for the columns a query reads, kept with the table
+    fresh = {"header": generated["header"], "data": list(generated["data"])}
+    numpy_backend.tables["fresh"] = fresh
+    numpy_backend.interpret("SELECT Id FROM fresh WHERE Temperatura > 30;")
+    print("Columns with arrays:", [fresh["header"][i] for i in sorted(fresh["arrays"])])
+    numpy_backend.append_rows("fresh", [["E1", "35.0", "0", "1.0", "ok"]])
+    output = numpy_backend.interpret("SELECT Id FROM fresh WHERE Temperatura > 30;")
+    print("Arrays extended to:", sorted(count for count, _ in fresh["arrays"].values()))
+    print("Ends with the appended row:", output[0].endswith("\nE1"))
+
+    # Cursors slice the column arrays too, with the same rows and types
+    for example in [
+        "SELECT Id, Temperatura FROM generated WHERE Radiacao > 100 LIMIT 50;",
+        "SELECT * FROM generated WHERE Nota = ok;",
+    ]:
+        print("Input:", example)
+        cursor = numpy_backend.query(example)
+        rows = cursor.fetchall()
+        expected = python_backend.query(example)
+        print("NumPy matches Python:", rows == expected.fetchall())
+        print("Same types:", cursor.description == expected.description)
+        print("-" * 40)
+    sliced = {
+        "header": ["Id", "Nota"],
+        "data": [[row[0], row[4]] for row in generated["data"]],
+    }
+    numpy_backend.tables["sliced"] = sliced
+    numpy_backend.query("SELECT Nota FROM sliced LIMIT 5;").fetchall()
+    print("SELECT builds arrays:", [sliced["header"][i] for i in sorted(sliced["arrays"])])
@@ -0,0 +1,130 @@
+import sys
+import os
+import random
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from interpreter import Interpreter
+
+interpreter = Interpreter()
+random.seed(1)
+start = datetime(2025, 4, 10)
+
+
+def observation(minutes):
+    return [
+        f"E{random.randint(1, 5)}",
+        (start + timedelta(minutes=minutes)).isoformat(timespec="minutes"),
+        random.choice(["", f"{random.uniform(-5, 40):.1f}"]),
+        str(random.randint(40, 100)),
+    ]
+
+
+# Observations every 20 minutes on average, some at the same time
+header = ["Id", "DataHoraObservacao", "Temperatura", "Humidade"]
+interpreter.tables["observacoes"] = {
+    "header": header,
+    "data": [observation(random.randint(0, 20 * 400) // 10 * 10) for _ in range(400)],
+}
+
+
+def expected(rows, function, col_name, partition, span):
+    """Compute a window aggregate by scanning the whole window of each row."""
+    col_index, time_index = header.index(col_name), header.index("DataHoraObservacao")
+    values = []
+    for row in rows:
+        end = datetime.fromisoformat(row[time_index])
+        window = [
+            other[col_index]
+            for other in rows
+            if (partition is None or other[0] == row[0])
+            and end - span <= datetime.fromisoformat(other[time_index]) <= end
+        ]
+        numbers = [Decimal(value) for value in window if value]
+        if function == "COUNT":
+            values.append(str(len([value for value in window if value])))
+        elif not numbers:
+            values.append("")
+        elif function == "AVG":
+            values.append(str(float(sum(numbers) / len(numbers))))
+        elif function == "SUM":
+            values.append(str(sum(numbers)))
+        else:
+            extreme = max(numbers) if function == "MAX" else min(numbers)
+            values.append(next(v for v in window if v and Decimal(v) == extreme))
+    return values
+
+
+examples = [
+    ("AVG", "Temperatura", "Id", "RANGE 3 HOURS", timedelta(hours=3)),
+    ("MAX", "Temperatura", "Id", "RANGE 3 HOURS", timedelta(hours=3)),
+    ("MIN", "Humidade", "Id", "RANGE 90 MINUTES", timedelta(minutes=90)),
+    ("SUM", "Temperatura", None, "RANGE 1 HOUR", timedelta(hours=1)),
+    ("COUNT", "Temperatura", "Id", "RANGE 0.5 DAYS", timedelta(hours=12)),
+]
+
+for function, col_name, partition, window_range, span in examples:
+    partition_by = f"PARTITION BY {partition} " if partition else ""
+    query = (
+        f"SELECT Id, DataHoraObservacao, {function}({col_name}) OVER "
+        f"({partition_by}ORDER BY DataHoraObservacao {window_range}) FROM observacoes;"
+    )
+    print("Input:", query)
+    rows = interpreter.query(query).fetchall()
+    text = interpreter.interpret(query)[0].split("\n")
+    print(text[0])
+    print("\n".join(text[2:5]))
+    values = [line.split(" | ")[2] for line in text[2:]]
+    data = interpreter.tables["observacoes"]["data"]
+    full = expected(data, function, col_name, partition, span)
+    print("Window matches full scan:", values == full)
+    print("Cursor rows:", len(rows), "typed as", type(rows[0][2]).__name__)
+    print("-" * 40)
+
+examples = [
+    "SELECT Id, AVG(Temperatura) OVER (PARTITION BY Id ORDER BY DataHoraObservacao "
+    "RANGE 3 HOURS) FROM observacoes WHERE Id = E2 LIMIT 3;",
+    "CREATE MATERIALIZED TABLE medias SELECT Id, DataHoraObservacao, "
+    "AVG(Temperatura) OVER (PARTITION BY Id ORDER BY DataHoraObservacao "
+    "RANGE 3 HOURS) FROM observacoes;",
+    "SELECT Id, MEDIAN(Temperatura) OVER (ORDER BY DataHoraObservacao RANGE 1 HOUR) "
+    "FROM observacoes;",
+    "SELECT Id, AVG(Temperatura) OVER (ORDER BY DataHoraObservacao RANGE 1 WEEK) "
+    "FROM observacoes;",
+    "SELECT Id, AVG(Pressao) OVER (ORDER BY DataHoraObservacao RANGE 1 HOUR) "
+    "FROM observacoes;",
+]
+
+for example in examples:
+    print("Input:", example)
+    print(interpreter.interpret(example))
+    print("-" * 40)
+
+# Appended rows change the windows of the rows around them
+interpreter.append_rows(
+    "observacoes", [observation(random.randint(0, 20 * 400)) for _ in range(20)]
+)
+data = interpreter.tables["observacoes"]["data"]
+values = [row[2] for row in interpreter.tables["medias"]["data"]]
+full = expected(data, "AVG", "Temperatura", "Id", timedelta(hours=3))
+print("Materialized windows match full scan after append:", values == full)
+
+# Sums are written the same way whatever values left the window before
+interpreter.tables["leituras"] = {
+    "header": header,
+    "data": [
+        row[:2] + [random.choice(["4", "4.0", "-1.25", "0.50", "2E+1", ""])] + row[3:]
+        for row in interpreter.tables["observacoes"]["data"]
+    ],
+}
+query = (
+    "SELECT Id, SUM(Temperatura) OVER (PARTITION BY Id ORDER BY DataHoraObservacao "
+    "RANGE 2 HOURS) FROM leituras;"
+)
+print("Input:", query)
+text = interpreter.interpret(query)[0].split("\n")
+values = [line.split(" | ")[1] for line in text[2:]]
+data = interpreter.tables["leituras"]["data"]
+full = expected(data, "SUM", "Temperatura", "Id", timedelta(hours=2))
+print("Window matches full scan:", values == full)
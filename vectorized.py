@@ -0,0 +1,130 @@
+from conditions import compare
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Comparison operators of the language applied to whole arrays
+OPERATORS = {
+    "=": lambda column, value: column == value,
+    "<>": lambda column, value: column != value,
+    "<": lambda column, value: column < value,
+    ">": lambda column, value: column > value,
+    "<=": lambda column, value: column <= value,
+    ">=": lambda column, value: column >= value,
+}
+
+
+def available():
+    """Check whether NumPy is installed."""
+    return np is not None
+
+
+class VectorizedBackend:
+    """Evaluate filters, LIMIT and projections over NumPy column arrays.
+
+    Values are compared as text, like in the pure Python path, so columns are
+    kept as NumPy string arrays. A column that cannot be stored as an array
+    (short rows, or values NumPy would alter) is read from the rows instead.
+
+    Arrays are only built for the columns a query reads, and are kept by the
+    caller in a per-table dictionary (column index -> (row count, array)).
+    """
+
+    def __init__(self, min_rows=1000):
+        # Smaller row lists are left to the pure Python path
+        self.min_rows = min_rows
+
+    def column_array(self, data, start, col_index):
+        """Build the array of one column from data[start:], or None."""
+        try:
+            values = [row[col_index] for row in data[start:]]
+        except IndexError:
+            return None
+        # NumPy drops trailing NUL characters from its strings
+        if any(type(value) is not str or "\x00" in value for value in values):
+            return None
+        return np.array(values, dtype=str)
+
+    def column(self, data, col_index, arrays):
+        """Return the array of a column, building it when needed.
+
+        Rows appended since the array was cached only have their own values
+        converted.
+        """
+        entry = arrays.get(col_index)
+        if entry is not None and entry[0] == len(data):
+            return entry[1]
+
+        if entry is not None and entry[0] < len(data):
+            array = entry[1]
+            if array is not None:
+                tail = self.column_array(data, entry[0], col_index)
+                array = None if tail is None else np.concatenate([array, tail])
+        else:
+            array = self.column_array(data, 0, col_index)
+        arrays[col_index] = (len(data), array)
+        return array
+
+    def mask(self, data, arrays, header, condition):
+        """Return the boolean mask of the rows matching a condition, or None
+        if the condition cannot be evaluated on the arrays.
+        """
+        if condition[0] == "CONDITION":
+            col_name, op, value = condition[1], condition[2], condition[3]
+            if col_name not in header or op not in OPERATORS:
+                return None
+            col_index = header.index(col_name)
+            column = self.column(data, col_index, arrays)
+            if column is not None:
+                return OPERATORS[op](column, str(value))
+
+            # Columns without an array are compared row by row
+            try:
+                matches = [compare(row[col_index], op, value) for row in data]
+            except IndexError:
+                return None
+            return np.array(matches, dtype=bool)
+
+        elif condition[0] == "AND":
+            left = self.mask(data, arrays, header, condition[1])
+            right = self.mask(data, arrays, header, condition[2])
+            if left is None or right is None:
+                return None
+            return left & right
+
+        return None
+
+    def select(self, data, header, condition, col_indices, limit, arrays=None):
+        """Return the rows of data matching a condition, up to limit rows,
+        projected on col_indices (None keeps whole rows).
+
+        arrays is the array cache of the table holding data. Returns None
+        when the query has to run on the pure Python path, which is the case
+        for row lists that are not a whole table.
+        """
+        if arrays is None or len(data) < self.min_rows:
+            return None
+
+        if condition:
+            mask = self.mask(data, arrays, header, condition)
+            if mask is None:
+                return None
+            indices = np.flatnonzero(mask)
+        else:
+            indices = np.arange(len(data))
+        if limit and limit > 0:
+            indices = indices[:limit]
+
+        if col_indices is None:
+            return [data[i] for i in indices.tolist()]
+
+        columns = []
+        for col_index in col_indices:
+            array = self.column(data, col_index, arrays)
+            if array is not None:
+                columns.append(array[indices].tolist())
+            else:
+                columns.append([data[i][col_index] for i in indices.tolist()])
+        return [list(row) for row in zip(*columns)]
@@ -0,0 +1,227 @@
+from collections import Counter, deque
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from cursor import DECIMAL
+
+# Length in seconds of the time units of a RANGE
+UNITS = {
+    "SECOND": 1,
+    "SECONDS": 1,
+    "MINUTE": 60,
+    "MINUTES": 60,
+    "HOUR": 3600,
+    "HOURS": 3600,
+    "DAY": 86400,
+    "DAYS": 86400,
+}
+
+
+def is_window(column):
+    """Check whether an entry of a select list is a window aggregate.
+
+    Window aggregates are ("WINDOW", function, column, partition column or
+    None, order column, range size, time unit or None) tuples.
+    """
+    return isinstance(column, tuple) and column[0] == "WINDOW"
+
+
+def has_windows(columns):
+    """Check whether a select list ("*" or a list) holds window aggregates."""
+    return columns != "*" and any(is_window(column) for column in columns)
+
+
+def column_name(column):
+    """Return the result column name of an entry of a select list."""
+    if is_window(column):
+        return f"{column[1]}({column[2]})"
+    return column
+
+
+def referenced_columns(columns):
+    """Return the table columns read by the entries of a select list."""
+    names = []
+    for column in columns:
+        if is_window(column):
+            names += [name for name in (column[2], column[3], column[4]) if name]
+        else:
+            names.append(column)
+    return names
+
+
+def validate(window):
+    """Raise ValueError for an unknown window function or time unit."""
+    if window[1] not in AGGREGATES:
+        raise ValueError(f"Unknown window function '{window[1]}'.")
+    if window[6] is not None and window[6] not in UNITS:
+        raise ValueError(f"Unknown time unit '{window[6]}'.")
+
+
+def number(value):
+    """Return a numeric CSV value as a Decimal, or None."""
+    if isinstance(value, str) and DECIMAL.match(value):
+        return Decimal(value)
+    return None
+
+
+def timestamp(value):
+    """Return the seconds since the epoch of an ISO 8601 date, or None.
+
+    Dates without a time zone are taken as UTC.
+    """
+    try:
+        moment = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+class RunningSum:
+    """Sum and count of the numeric values in a window, and how many of them
+    have each exponent.
+    """
+
+    def __init__(self):
+        self.total = Decimal(0)
+        self.count = 0
+        self.exponents = Counter()
+
+    def add(self, index, text):
+        value = number(text)
+        if value is not None:
+            self.total += value
+            self.count += 1
+            self.exponents[value.as_tuple().exponent] += 1
+
+    def evict(self, index, text):
+        value = number(text)
+        if value is not None:
+            self.total -= value
+            self.count -= 1
+            exponent = value.as_tuple().exponent
+            self.exponents[exponent] -= 1
+            if not self.exponents[exponent]:
+                del self.exponents[exponent]
+
+
+class Sum(RunningSum):
+    def result(self):
+        if not self.count:
+            return ""
+        # The total keeps the digits of evicted values: write it with those of
+        # the values in the window, as adding them up from zero would
+        exponent = min(0, min(self.exponents))
+        return str(self.total.quantize(Decimal(1).scaleb(exponent)))
+
+
+class Average(RunningSum):
+    def result(self):
+        return str(float(self.total / self.count)) if self.count else ""
+
+
+class Count:
+    """Number of non-empty values in a window."""
+
+    def __init__(self):
+        self.count = 0
+
+    def add(self, index, text):
+        if text:
+            self.count += 1
+
+    def evict(self, index, text):
+        if text:
+            self.count -= 1
+
+    def result(self):
+        return str(self.count)
+
+
+class Extreme:
+    """Maximum (or minimum, with sign -1) of the numeric values in a window.
+
+    The deque holds (index, value, text) for the values that can still become
+    the extreme, in index order and with decreasing sign * value, so the
+    extreme is at its front.
+    """
+
+    def __init__(self, sign=1):
+        self.sign = sign
+        self.candidates = deque()
+
+    def add(self, index, text):
+        value = number(text)
+        if value is None:
+            return
+        value *= self.sign
+        while self.candidates and self.candidates[-1][1] <= value:
+            self.candidates.pop()
+        self.candidates.append((index, value, text))
+
+    def evict(self, index, text):
+        if self.candidates and self.candidates[0][0] == index:
+            self.candidates.popleft()
+
+    def result(self):
+        return self.candidates[0][2] if self.candidates else ""
+
+
+AGGREGATES = {
+    "AVG": Average,
+    "SUM": Sum,
+    "COUNT": Count,
+    "MAX": Extreme,
+    "MIN": lambda: Extreme(-1),
+}
+
+
+def window_values(rows, header, window):
+    """Return the value of a window aggregate for each row, as strings.
+
+    The window of a row holds the rows of its partition whose order value is
+    at most the range size before its own, itself and its peers included.
+    Each partition is scanned once in order, adding the rows entering the
+    window and evicting the ones leaving it, so each row costs O(1) amortized
+    after sorting. Rows without a valid order value get an empty value.
+    """
+    _, function, col_name, partition, order, size, unit = window
+    col_index = header.index(col_name)
+    order_index = header.index(order)
+    partition_index = header.index(partition) if partition else None
+    if unit is None:
+        span, position_of = Decimal(str(size)), number
+    else:
+        span, position_of = size * UNITS[unit], timestamp
+
+    # (position, row id) of the rows of each partition
+    partitions = {}
+    for row_id, row in enumerate(rows):
+        position = position_of(row[order_index])
+        if position is None:
+            continue
+        key = row[partition_index] if partition_index is not None else None
+        partitions.setdefault(key, []).append((position, row_id))
+
+    results = [""] * len(rows)
+    for members in partitions.values():
+        # Rows usually come in order already, which sorts in linear time
+        members.sort()
+        aggregate = AGGREGATES[function]()
+        start = end = 0
+        while end < len(members):
+            position = members[end][0]
+            # The row enters the window along with its peers
+            peers = end
+            while end < len(members) and members[end][0] == position:
+                aggregate.add(end, rows[members[end][1]][col_index])
+                end += 1
+            while members[start][0] < position - span:
+                aggregate.evict(start, rows[members[start][1]][col_index])
+                start += 1
+
+            value = aggregate.result()
+            for _, row_id in members[peers:end]:
+                results[row_id] = value
+    return results